@@ -9,7 +9,13 @@ from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_TOKEN, DOMAIN
+from .const import (
+    CONF_TOKEN,
+    DOMAIN,
+    IDLE_STATUSES,
+    IDLE_UPDATE_INTERVAL_MAX,
+    UPDATE_INTERVAL,
+)
 from .snapmaker import SnapmakerDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,14 +68,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Lock to prevent race conditions in reauth flag management
     reauth_lock = asyncio.Lock()
     reauth_triggered = False
+    previous_status = None
 
     async def async_update_data():
         """Fetch data from the Snapmaker device."""
-        nonlocal reauth_triggered
+        nonlocal reauth_triggered, previous_status
 
         try:
             result = await hass.async_add_executor_job(snapmaker.update)
 
+            # Poll an idle printer less often; any change restores the base rate
+            if (
+                snapmaker.status in IDLE_STATUSES
+                and snapmaker.status == previous_status
+            ):
+                coordinator.update_interval = min(
+                    coordinator.update_interval * 2,
+                    timedelta(seconds=IDLE_UPDATE_INTERVAL_MAX),
+                )
+            else:
+                coordinator.update_interval = timedelta(seconds=UPDATE_INTERVAL)
+            previous_status = snapmaker.status
+
             # Check if token is invalid and trigger reauth (only once)
             # Use lock to ensure atomic check-then-set of reauth flag
             async with reauth_lock:
@@ -102,11 +122,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER,
         name=f"Snapmaker {host}",
         update_method=async_update_data,
-        update_interval=timedelta(seconds=30),
+        update_interval=timedelta(seconds=UPDATE_INTERVAL),
     )
 
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Home Assistant retries a failed setup with a new device, so release
+        # this one's socket and HTTP session
+        await hass.async_add_executor_job(snapmaker.close)
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -124,6 +150,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        # Stop polling before closing the socket and session updates run on
+        await entry_data["coordinator"].async_shutdown()
+        await hass.async_add_executor_job(entry_data["device"].close)
 
     return unload_ok
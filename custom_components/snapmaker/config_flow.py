@@ -3,6 +3,7 @@
 import logging
 
 from homeassistant import config_entries
+from homeassistant.components import network
 from homeassistant.const import CONF_HOST
 from homeassistant.data_entry_flow import FlowResult
 import voluptuous as vol
@@ -57,6 +58,8 @@ class SnapmakerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
+            finally:
+                await self.hass.async_add_executor_job(snapmaker.close)
 
         # Show form
         return self.async_show_form(
@@ -142,11 +145,15 @@ class SnapmakerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     except Exception as validation_err:
                         _LOGGER.exception("Error validating new token")
                         errors["base"] = "unknown"
+                    finally:
+                        await self.hass.async_add_executor_job(test_device.close)
                 else:
                     errors["base"] = "auth_failed"
             except Exception as err:
                 _LOGGER.exception("Unexpected exception during authorization")
                 errors["base"] = "unknown"
+            finally:
+                await self.hass.async_add_executor_job(snapmaker.close)
 
         # Show authorization form with instructions
         return self.async_show_form(
@@ -175,6 +182,8 @@ class SnapmakerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return await self._validate_and_authorize(host, snapmaker.model or host)
         except Exception:
             pass
+        finally:
+            await self.hass.async_add_executor_job(snapmaker.close)
 
         # We need user confirmation
         self.context["host"] = host
@@ -200,6 +209,8 @@ class SnapmakerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
+            finally:
+                await self.hass.async_add_executor_job(snapmaker.close)
 
         # Show confirmation form
         return self.async_show_form(
@@ -240,8 +251,14 @@ class SnapmakerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.context["model"] = device_info.get("model", host)
             return await self.async_step_authorize()
 
-        # Discover devices
-        devices = await self.hass.async_add_executor_job(SnapmakerDevice.discover)
+        # Discover devices on every enabled network interface
+        broadcast_addresses = await network.async_get_ipv4_broadcast_addresses(
+            self.hass
+        )
+        devices = await self.hass.async_add_executor_job(
+            SnapmakerDevice.discover,
+            [str(address) for address in broadcast_addresses],
+        )
 
         if not devices:
             return self.async_abort(reason="no_devices_found")
@@ -308,6 +325,8 @@ class SnapmakerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:
                 _LOGGER.exception("Unexpected exception during reauth")
                 errors["base"] = "unknown"
+            finally:
+                await self.hass.async_add_executor_job(snapmaker.close)
 
         return self.async_show_form(
             step_id="reauth_confirm",
@@ -8,6 +8,12 @@ CONF_TOKEN = "token"
 # Default values
 DEFAULT_NAME = "Snapmaker"
 
+# Polling intervals (seconds). While the printer reports the same idle status
+# poll after poll, the interval doubles up to the maximum.
+UPDATE_INTERVAL = 30
+IDLE_UPDATE_INTERVAL_MAX = 120
+IDLE_STATUSES = frozenset({"IDLE", "FINISHED"})
+
 # Configuration keys
 CONF_TOKEN = "token"
 
@@ -1,13 +1,18 @@
 """Snapmaker device communication module."""
 
 from datetime import timedelta
-import json
+from functools import lru_cache
 import logging
+import re
 import socket
 import time
-from typing import Any, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Set, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from .const import TOOLHEAD_MAP, TOOLHEAD_TYPE_DUAL_EXTRUDER
 
@@ -16,33 +21,217 @@ _LOGGER = logging.getLogger(__name__)
 # Network configuration constants
 DISCOVER_PORT = 20054
 DISCOVER_MESSAGE = b"discover"
-SOCKET_TIMEOUT = 1.0  # Seconds to wait for UDP responses
-MAX_RETRIES = 5  # Number of discovery attempts before marking device offline
-RETRY_DELAY = 0.5  # Seconds to wait between discovery retry attempts
+BROADCAST_ADDRESS = "255.255.255.255"
+SOCKET_TIMEOUT = 0.5  # Seconds to wait for UDP responses
+# Listen window (seconds) after each discovery broadcast: one long listen,
+# then a single resend with a shorter window before marking the device offline
+DISCOVERY_LISTEN_WINDOWS = (SOCKET_TIMEOUT * 2, SOCKET_TIMEOUT)
 BUFFER_SIZE = 1024  # UDP receive buffer size in bytes
-API_TIMEOUT = 5  # Seconds to wait for HTTP API responses
+# (connect, read) seconds for HTTP API calls. A LAN connect either completes
+# within a few milliseconds or the device is down.
+API_TIMEOUT = (1.0, 2.0)
+# Retry status requests that hit a transient gateway error from the firmware's
+# web server. Only idempotent methods are retried, so /connect POSTs are not.
+# A Retry-After header is ignored: its uncapped sleep would block the executor.
+API_RETRY = Retry(
+    total=2,
+    connect=0,
+    read=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
 API_PORT = 8080  # Default HTTP API port
+# Seconds to wait before repeating a failed /connect handshake during updates.
+# Short enough that approving the device on its touchscreen takes effect
+# within a couple of polls.
+TOKEN_RETRY_INTERVAL = 60
 TCP_CHECK_TIMEOUT = 1.0  # Seconds to wait for TCP reachability check
 REACHABILITY_MAX_RETRIES = 2  # Max retries for reachability check
-# Base for exponential backoff (seconds). Kept low because time.sleep()
-# blocks the executor thread during the coordinator update cycle.
-REACHABILITY_BACKOFF_BASE = 1
+# Exponential backoff between TCP checks: INITIAL * BASE**attempt seconds.
+# Kept short because time.sleep() blocks the executor thread during the
+# coordinator update cycle.
+REACHABILITY_BACKOFF_INITIAL = 0.25
+REACHABILITY_BACKOFF_BASE = 2
+
+# Discovery reply, e.g. b"IP@192.168.1.100|Model:Snapmaker A350|Status:IDLE".
+# Each field is matched up to its first separator; trailing fields are ignored.
+_DISCOVERY_RE = re.compile(
+    rb"^[^@|]*@(?P<ip>[^|]*)\|[^:|]*:(?P<model>[^|]*)\|[^:|]*:(?P<status>[^|]*)"
+)
+
+# Data reported while the device is offline. This is also the key set a
+# single-nozzle status update fills in; "ip" and "model" are per device.
+_OFFLINE_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+    {
+        "ip": None,
+        "model": "N/A",
+        "status": "OFFLINE",
+        "nozzle_temperature": None,
+        "nozzle_target_temperature": None,
+        "heated_bed_temperature": None,
+        "heated_bed_target_temperature": None,
+        "file_name": "N/A",
+        "progress": None,
+        "elapsed_time": "N/A",
+        "remaining_time": "N/A",
+        "estimated_time": "N/A",
+        "tool_head": "N/A",
+        "x": None,
+        "y": None,
+        "z": None,
+        "homing": "N/A",
+        "is_filament_out": False,
+        "is_door_open": False,
+        "has_enclosure": False,
+        "has_rotary_module": False,
+        "has_emergency_stop": False,
+        "has_air_purifier": False,
+        "total_lines": None,
+        "current_line": None,
+    }
+)
+
+# Status API fields copied as-is: (API key, data key, default when missing)
+_STATUS_FIELDS: Tuple[Tuple[str, str, Any], ...] = (
+    ("status", "status", None),
+    ("heatedBedTemperature", "heated_bed_temperature", 0),
+    ("heatedBedTargetTemperature", "heated_bed_target_temperature", 0),
+    ("fileName", "file_name", "N/A"),
+    ("x", "x", 0),
+    ("y", "y", 0),
+    ("z", "z", 0),
+    ("homing", "homing", "N/A"),
+    ("isFilamentOut", "is_filament_out", False),
+    ("isDoorOpen", "is_door_open", False),
+    ("enclosure", "has_enclosure", False),
+    ("rotaryModule", "has_rotary_module", False),
+    ("emergencyStop", "has_emergency_stop", False),
+    ("airPurifier", "has_air_purifier", False),
+    ("totalLines", "total_lines", 0),
+    ("currentLine", "current_line", 0),
+)
+_SINGLE_NOZZLE_FIELDS: Tuple[Tuple[str, str, Any], ...] = (
+    ("nozzleTemperature", "nozzle_temperature", 0),
+    ("nozzleTargetTemperature", "nozzle_target_temperature", 0),
+)
+_DUAL_NOZZLE_FIELDS: Tuple[Tuple[str, str, Any], ...] = (
+    ("nozzle1Temperature", "nozzle1_temperature", 0),
+    ("nozzle1TargetTemperature", "nozzle1_target_temperature", 0),
+    ("nozzle2Temperature", "nozzle2_temperature", 0),
+    ("nozzle2TargetTemperature", "nozzle2_target_temperature", 0),
+)
+# CNC/Laser fields, only reported when the device sends them
+_OPTIONAL_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("spindleSpeed", "spindle_speed"),
+    ("laserPower", "laser_power"),
+    ("laserFocalLength", "laser_focal_length"),
+)
 
 # Keys to strip from the raw API response before exposing as diagnostic attributes
 SENSITIVE_API_KEYS = {"token"}
 
-# Patterns that indicate potentially sensitive API keys
-_SENSITIVE_KEY_PATTERNS = ("token", "password", "secret", "key", "credential")
+# Pattern that indicates potentially sensitive API keys
+_SENSITIVE_KEY_RE = re.compile(r"token|password|secret|key|credential", re.IGNORECASE)
+
+
+def _parse_discovery(reply: bytes, addr: tuple) -> Optional[Tuple[str, str, str]]:
+    """Parse a UDP discovery reply.
+
+    Args:
+        reply: Raw datagram received on the discovery socket.
+        addr: Address the datagram came from, used when logging bad replies.
+
+    Returns:
+        Optional[Tuple[str, str, str]]: The (ip, model, status) fields, or None
+        if the reply is malformed.
+    """
+    # Cheap byte-level checks reject unrelated datagrams before the regex runs
+    match = None
+    if b"@" in reply and reply.count(b"|") >= 2:
+        match = _DISCOVERY_RE.match(reply)
+    if match is None:
+        _LOGGER.warning("Malformed discovery response from %s: %r", addr[0], reply)
+        return None
+
+    try:
+        sn_ip, sn_model, sn_status = (
+            field.decode("utf-8") for field in match.group("ip", "model", "status")
+        )
+    except UnicodeDecodeError as parse_err:
+        _LOGGER.warning(
+            "Failed to parse discovery response from %s: %s", addr[0], parse_err
+        )
+        return None
+    return sn_ip, sn_model, sn_status
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(seconds: float) -> str:
+    """Format a duration in seconds as H:MM:SS.
+
+    Print times tick by one second between polls and repeat across devices,
+    so the formatted strings are cached.
+    """
+    return str(timedelta(seconds=seconds))
+
+
+def _format_progress(progress: float) -> float:
+    """Convert a 0..1 progress fraction to a percentage with one decimal.
+
+    A whole fraction such as 1 parses as an int; the result is always a float.
+    """
+    return float(round(progress * 100, 1))
+
+
+# Fields whose raw value is converted before storing. The default is stored
+# as-is when the device omits the field.
+_CONVERTED_FIELDS: Tuple[Tuple[str, str, Any, Callable[[Any], Any]], ...] = (
+    ("progress", "progress", 0.0, _format_progress),
+    ("elapsedTime", "elapsed_time", "00:00:00", _format_duration),
+    ("remainingTime", "remaining_time", "00:00:00", _format_duration),
+    ("estimatedTime", "estimated_time", "00:00:00", _format_duration),
+)
 
 
 class SnapmakerDevice:
     """Class to communicate with a Snapmaker device."""
 
+    __slots__ = (
+        "_host",
+        "_address",
+        "_token",
+        "_data",
+        "_last_status_payload",
+        "_last_status_data",
+        "_offline_data",
+        "_raw_api_response",
+        "_available",
+        "_model",
+        "_status",
+        "_dual_extruder",
+        "_toolhead_type",
+        "_on_token_update",
+        "_token_invalid",
+        "_token_retry_at",
+        "_checked_api_keys",
+        "_udp_socket",
+        "_session",
+    )
+
     def __init__(self, host: str, token: Optional[str] = None):
         """Initialize the Snapmaker device."""
         self._host = host
+        # IP address of host, resolved on first use (see _resolve_host)
+        self._address: Optional[str] = None
         self._token = token
         self._data: Dict[str, Any] = {}
+        # Last status body and the data dict it was applied to
+        self._last_status_payload: Optional[bytes] = None
+        self._last_status_data: Optional[Dict[str, Any]] = None
+        # Data last built by _set_offline(), reused while the device stays offline
+        self._offline_data: Optional[Dict[str, Any]] = None
         self._raw_api_response: Dict[str, Any] = {}
         self._available = False
         self._model = None
@@ -51,6 +240,18 @@ class SnapmakerDevice:
         self._toolhead_type: Optional[str] = None
         self._on_token_update: Optional[Callable[[str], None]] = None
         self._token_invalid = False
+        # Monotonic time before which update() won't retry a failed handshake
+        self._token_retry_at = 0.0
+        # API response keys already screened for sensitive-looking names
+        self._checked_api_keys: Set[str] = set()
+        # Discovery socket, created on first use and reused across polls
+        self._udp_socket: Optional[socket.socket] = None
+        # Reuse one keep-alive connection to the device's HTTP API across polls
+        self._session = requests.Session()
+        self._session.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=API_RETRY),
+        )
 
     @property
     def host(self) -> str:
@@ -125,6 +326,26 @@ class SnapmakerDevice:
         """Set callback to be called when token is updated."""
         self._on_token_update = callback
 
+    def close(self) -> None:
+        """Release the discovery socket and pooled HTTP connections."""
+        self._close_udp_socket()
+        self._session.close()
+
+    def _resolve_host(self) -> str:
+        """Return the device's IP address, resolving a hostname only once.
+
+        The address is cached until the device goes offline, so polls don't
+        pay a DNS or mDNS lookup per connection. An IP address resolves to
+        itself without a lookup.
+        """
+        if self._address is None:
+            try:
+                self._address = socket.gethostbyname(self._host)
+            except OSError as err:
+                _LOGGER.debug("Could not resolve %s: %s", self._host, err)
+                return self._host
+        return self._address
+
     def _check_reachable(self) -> bool:
         """Check if the device API port is reachable via TCP.
 
@@ -139,7 +360,7 @@ class SnapmakerDevice:
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(TCP_CHECK_TIMEOUT)
-                result = sock.connect_ex((self._host, API_PORT))
+                result = sock.connect_ex((self._resolve_host(), API_PORT))
                 sock.close()
                 if result == 0:
                     return True
@@ -147,9 +368,11 @@ class SnapmakerDevice:
                 pass
 
             if attempt < REACHABILITY_MAX_RETRIES - 1:
-                backoff = REACHABILITY_BACKOFF_BASE**attempt
+                backoff = REACHABILITY_BACKOFF_INITIAL * (
+                    REACHABILITY_BACKOFF_BASE**attempt
+                )
                 _LOGGER.debug(
-                    "TCP check failed for %s:%d (attempt %d/%d), retrying in %ds",
+                    "TCP check failed for %s:%d (attempt %d/%d), retrying in %.2fs",
                     self._host,
                     API_PORT,
                     attempt + 1,
@@ -168,24 +391,30 @@ class SnapmakerDevice:
         return False
 
     def update(self) -> Dict[str, Any]:
-        """Update device data."""
-        # First check if device is online via discovery
-        self._check_online()
+        """Update device data.
+
+        UDP discovery only runs on the first update or after the device
+        stopped answering on its API port. While the known host keeps
+        accepting TCP connections, the broadcast and its timeout are skipped.
+        Without a token the HTTP status is unavailable and the discovery
+        reply is the only source of the status, so discovery keeps running.
+        """
+        if self._available and self._token and self._check_reachable():
+            _LOGGER.debug("Device %s still reachable, skipping discovery", self._host)
+        else:
+            # Check if device is online via discovery. A closed API port is
+            # caught by the HTTP calls below, which go offline on ConnectionError.
+            self._check_online()
 
         # If device is online and we have a token, get detailed status
         if self._available and self._status != "OFFLINE":
-            # TCP reachability pre-check before making HTTP calls
-            if not self._check_reachable():
-                _LOGGER.warning(
-                    "Device %s discovered but API port %d not reachable",
-                    self._host,
-                    API_PORT,
-                )
-                self._set_offline()
-                return self._data
-
-            if not self._token:
+            if not self._token and time.monotonic() >= self._token_retry_at:
                 self._token = self._get_token()
+                if not self._token and self._available:
+                    # The device answered but refused or ignored the handshake,
+                    # usually because it was not approved on the touchscreen.
+                    # Don't repeat both POSTs on every poll.
+                    self._token_retry_at = time.monotonic() + TOKEN_RETRY_INTERVAL
 
             if self._token:
                 self._get_status()
@@ -197,153 +426,145 @@ class SnapmakerDevice:
 
         Uses None for numeric values that are unknown when offline,
         allowing HA to display "unknown" rather than misleading zeros.
+        A device that stays offline keeps its existing offline data instead
+        of rebuilding it on every poll.
         """
+        if not self._available and self._data is self._offline_data:
+            return
+
         self._available = False
         self._status = "OFFLINE"
         self._raw_api_response = {}
-        self._data = {
+        # Resolve the host again in case its address changed while it was away
+        self._address = None
+        # Try the handshake again as soon as the device comes back
+        self._token_retry_at = 0.0
+        self._data = self._offline_data = {
+            **_OFFLINE_TEMPLATE,
             "ip": self._host,
             "model": self._model or "N/A",
-            "status": "OFFLINE",
-            "nozzle_temperature": None,
-            "nozzle_target_temperature": None,
-            "heated_bed_temperature": None,
-            "heated_bed_target_temperature": None,
-            "file_name": "N/A",
-            "progress": None,
-            "elapsed_time": "N/A",
-            "remaining_time": "N/A",
-            "estimated_time": "N/A",
-            "tool_head": "N/A",
-            "x": None,
-            "y": None,
-            "z": None,
-            "homing": "N/A",
-            "is_filament_out": False,
-            "is_door_open": False,
-            "has_enclosure": False,
-            "has_rotary_module": False,
-            "has_emergency_stop": False,
-            "has_air_purifier": False,
-            "total_lines": None,
-            "current_line": None,
         }
 
     def _check_online(self) -> None:
         """Check if device is online via discovery.
 
-        Note: A new UDP socket is created for each discovery attempt.
-        This is intentional for UDP broadcast discovery as it avoids stale
-        state and the overhead is minimal. For persistent connections,
-        use the HTTP API with token authentication.
+        The discovery message is sent straight to the known host rather than
+        broadcast, so other devices on the LAN are not woken up every poll.
+        Replies are collected for a long listen window. If the device did
+        not answer, the message is broadcast once with a shorter window, in
+        case unicast is being dropped, before the device is marked offline.
+
+        The UDP socket is created on first use and kept for the lifetime of
+        the device; close() releases it. A socket that raises OSError is
+        discarded and rebuilt.
         """
-        udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
-        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        udp_socket.settimeout(SOCKET_TIMEOUT)
+        for attempt, window in enumerate(DISCOVERY_LISTEN_WINDOWS, start=1):
+            try:
+                udp_socket = self._get_udp_socket()
+                if attempt == 1:
+                    self._drain_udp_socket(udp_socket)
+
+                # Probe the known host first; fall back to broadcast
+                destination = (
+                    self._resolve_host() if attempt == 1 else BROADCAST_ADDRESS
+                )
+                udp_socket.sendto(DISCOVER_MESSAGE, (destination, DISCOVER_PORT))
+                if self._receive_discovery_reply(udp_socket, window):
+                    # Return right away; discard other replies already queued
+                    # without waiting for more to arrive
+                    self._drain_udp_socket(udp_socket)
+                    return
+            except Exception as err:
+                _LOGGER.error(
+                    "Error checking Snapmaker status (attempt %d/%d): %s",
+                    attempt,
+                    len(DISCOVERY_LISTEN_WINDOWS),
+                    err,
+                )
+                if isinstance(err, OSError):
+                    # The socket may be unusable (e.g. its interface went
+                    # away), so build a fresh one for the next attempt
+                    self._close_udp_socket()
 
+        _LOGGER.warning(
+            "Failed to discover device %s after %d attempts, marking offline",
+            self._host,
+            len(DISCOVERY_LISTEN_WINDOWS),
+        )
+        self._set_offline()
+
+    def _get_udp_socket(self) -> socket.socket:
+        """Return the discovery socket, creating it on first use."""
+        if self._udp_socket is None:
+            udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+            # Needed for the broadcast fallback in _check_online
+            udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            self._udp_socket = udp_socket
+        return self._udp_socket
+
+    def _close_udp_socket(self) -> None:
+        """Close the discovery socket; the next poll creates a new one."""
+        if self._udp_socket is not None:
+            self._udp_socket.close()
+            self._udp_socket = None
+
+    @staticmethod
+    def _drain_udp_socket(udp_socket: socket.socket) -> None:
+        """Discard late replies queued on the socket since the last poll."""
+        udp_socket.setblocking(False)
         try:
-            retry_count = 0
-            while retry_count < MAX_RETRIES:
-                try:
-                    # Send discovery message to broadcast address
-                    udp_socket.sendto(
-                        DISCOVER_MESSAGE, ("255.255.255.255", DISCOVER_PORT)
-                    )
+            while True:
+                udp_socket.recv(BUFFER_SIZE)
+        except BlockingIOError:
+            pass
 
-                    # Wait for responses and filter for our target host
-                    found = False
-
-                    while True:
-                        try:
-                            reply, addr = udp_socket.recvfrom(BUFFER_SIZE)
-
-                            # Parse response - decode bytes properly
-                            try:
-                                response_str = reply.decode("utf-8")
-                                elements = response_str.split("|")
-
-                                if len(elements) < 3:
-                                    _LOGGER.warning(
-                                        "Invalid discovery response format: %s",
-                                        response_str,
-                                    )
-                                    continue
-
-                                sn_ip = elements[0]
-                                sn_model = elements[1]
-                                sn_status = elements[2]
-
-                                # Parse fields with validation
-                                if (
-                                    "@" not in sn_ip
-                                    or ":" not in sn_model
-                                    or ":" not in sn_status
-                                ):
-                                    _LOGGER.warning(
-                                        "Malformed discovery response: %s", response_str
-                                    )
-                                    continue
-
-                                # Split and discard prefix (e.g., "IP@" becomes "192.168.1.100")
-                                _, sn_ip_val = sn_ip.split("@", 1)
-                                _, sn_model_val = sn_model.split(":", 1)
-                                _, sn_status_val = sn_status.split(":", 1)
-
-                                # Check if this response is from our target host
-                                if sn_ip_val == self._host or addr[0] == self._host:
-                                    # Update device info
-                                    self._available = True
-                                    self._model = sn_model_val
-                                    self._status = sn_status_val
-                                    self._data = {
-                                        "ip": sn_ip_val,
-                                        "model": sn_model_val,
-                                        "status": sn_status_val,
-                                    }
-                                    found = True
-                                    break
-                            except (UnicodeDecodeError, ValueError) as parse_err:
-                                _LOGGER.warning(
-                                    "Failed to parse discovery response: %s", parse_err
-                                )
-                                continue
-
-                        except socket.timeout:
-                            # No more responses in this iteration
-                            break
-
-                    # Exit retry loop immediately if device was found
-                    if found:
-                        break
-
-                    # If we didn't find our device, retry after a brief delay
-                    retry_count += 1
-                    if retry_count < MAX_RETRIES:
-                        time.sleep(RETRY_DELAY)
-
-                except Exception as err:
-                    _LOGGER.error(
-                        "Error checking Snapmaker status (attempt %d/%d): %s",
-                        retry_count + 1,
-                        MAX_RETRIES,
-                        err,
-                    )
-                    retry_count += 1
-                    if retry_count < MAX_RETRIES:
-                        time.sleep(RETRY_DELAY)
+    def _receive_discovery_reply(
+        self, udp_socket: socket.socket, window: float
+    ) -> bool:
+        """Wait up to window seconds for this device to answer discovery.
 
-            # If we exhausted all retries without finding the device, mark as offline
-            if retry_count >= MAX_RETRIES:
-                _LOGGER.warning(
-                    "Failed to discover device %s after %d attempts, marking offline",
-                    self._host,
-                    MAX_RETRIES,
-                )
-                self._set_offline()
+        Any other datagram on the socket is skipped without extending the
+        window.
 
-        finally:
-            # Always close the socket, even if an exception occurred
-            udp_socket.close()
+        Returns:
+            True if the device answered and its state was updated.
+        """
+        targets = (self._host, self._resolve_host())
+        target_bytes = tuple(target.encode() for target in targets)
+        deadline = time.monotonic() + window
+        while (remaining := deadline - time.monotonic()) > 0:
+            udp_socket.settimeout(remaining)
+            try:
+                reply, addr = udp_socket.recvfrom(BUFFER_SIZE)
+            except socket.timeout:
+                return False
+
+            # Only parse replies that came from, or mention, this device.
+            # Other hosts answering the broadcast resend are dropped unparsed.
+            if addr[0] not in targets and not any(
+                target in reply for target in target_bytes
+            ):
+                continue
+
+            parsed = _parse_discovery(reply, addr)
+            if parsed is None:
+                continue
+            sn_ip_val, sn_model_val, sn_status_val = parsed
+
+            # Check if this response is from our target host
+            if sn_ip_val in targets or addr[0] in targets:
+                # Update device info
+                self._available = True
+                self._model = sn_model_val
+                self._status = sn_status_val
+                self._data = {
+                    "ip": sn_ip_val,
+                    "model": sn_model_val,
+                    "status": sn_status_val,
+                }
+                return True
+
+        return False
 
     def generate_token(
         self, max_attempts: int = 18, poll_interval: int = 10
@@ -368,11 +589,11 @@ class SnapmakerDevice:
             Optional[str]: Authentication token if successful, None otherwise
         """
         try:
-            url = f"http://{self._host}:{API_PORT}/api/v1/connect"
+            url = f"http://{self._resolve_host()}:{API_PORT}/api/v1/connect"
 
             # First request to initiate connection
             _LOGGER.info("Requesting token from Snapmaker at %s", self._host)
-            response = requests.post(url, timeout=API_TIMEOUT)
+            response = self._session.post(url, timeout=API_TIMEOUT)
 
             # Check HTTP status before parsing response
             try:
@@ -387,8 +608,8 @@ class SnapmakerDevice:
 
             # Extract token from response
             try:
-                token = json.loads(response.text).get("token")
-            except (json.JSONDecodeError, ValueError) as json_err:
+                token = orjson.loads(response.content).get("token")
+            except orjson.JSONDecodeError as json_err:
                 _LOGGER.error(
                     "Failed to parse token response: %s. Response: %s",
                     json_err,
@@ -419,7 +640,7 @@ class SnapmakerDevice:
                         time.sleep(poll_interval)
 
                     # Try to validate token by posting it back to the device
-                    response = requests.post(
+                    response = self._session.post(
                         url, data=form_data, headers=headers, timeout=API_TIMEOUT
                     )
 
@@ -429,7 +650,7 @@ class SnapmakerDevice:
                     # Check if token was validated by Snapmaker
                     # Per Snapmaker API spec, a successful validation echoes back the same token
                     try:
-                        response_data = json.loads(response.text)
+                        response_data = orjson.loads(response.content)
                         if response_data.get("token") == token:
                             _LOGGER.info("Token validated successfully")
                             self._token = token
@@ -438,7 +659,7 @@ class SnapmakerDevice:
                             if self._on_token_update:
                                 self._on_token_update(token)
                             return token
-                    except (json.JSONDecodeError, ValueError) as json_err:
+                    except orjson.JSONDecodeError as json_err:
                         _LOGGER.debug(
                             "Token validation attempt %d/%d: %s",
                             attempt + 1,
@@ -496,10 +717,10 @@ class SnapmakerDevice:
         self._token_invalid = False
 
         try:
-            url = f"http://{self._host}:{API_PORT}/api/v1/connect"
+            url = f"http://{self._resolve_host()}:{API_PORT}/api/v1/connect"
 
             # First request to initiate connection
-            response = requests.post(url, timeout=API_TIMEOUT)
+            response = self._session.post(url, timeout=API_TIMEOUT)
 
             # Check HTTP status before parsing response
             try:
@@ -514,8 +735,8 @@ class SnapmakerDevice:
 
             # Extract token from response
             try:
-                token = json.loads(response.text).get("token")
-            except (json.JSONDecodeError, ValueError) as json_err:
+                token = orjson.loads(response.content).get("token")
+            except orjson.JSONDecodeError as json_err:
                 _LOGGER.error(
                     "Failed to parse token response: %s. Response: %s",
                     json_err,
@@ -530,13 +751,16 @@ class SnapmakerDevice:
             # Second request to validate token
             headers = {"Content-Type": "application/x-www-form-urlencoded"}
             form_data = {"token": token}
-            response = requests.post(
+            response = self._session.post(
                 url, data=form_data, headers=headers, timeout=API_TIMEOUT
             )
 
+            # An error page is never a token echo, so don't try to parse it
+            response.raise_for_status()
+
             # Validate token response with JSON error handling
             try:
-                response_data = json.loads(response.text)
+                response_data = orjson.loads(response.content)
                 if response_data.get("token") == token:
                     _LOGGER.info("Successfully connected to Snapmaker")
                     self._token_invalid = False
@@ -544,12 +768,16 @@ class SnapmakerDevice:
                     if self._on_token_update:
                         self._on_token_update(token)
                     return token
-            except (json.JSONDecodeError, ValueError) as json_err:
+            except orjson.JSONDecodeError as json_err:
                 _LOGGER.error("Failed to parse token validation response: %s", json_err)
                 return None
 
             _LOGGER.error("Token validation failed")
             return None
+        except requests.exceptions.ConnectionError as conn_err:
+            _LOGGER.error("Could not connect to Snapmaker API: %s", conn_err)
+            self._set_offline()
+            return None
         except requests.exceptions.RequestException as req_err:
             _LOGGER.error("Network error getting token from Snapmaker: %s", req_err)
             return None
@@ -560,8 +788,8 @@ class SnapmakerDevice:
     def _get_status(self) -> None:
         """Get status from Snapmaker device."""
         try:
-            url = f"http://{self._host}:{API_PORT}/api/v1/status"
-            response = requests.get(
+            url = f"http://{self._resolve_host()}:{API_PORT}/api/v1/status"
+            response = self._session.get(
                 url, params={"token": self._token}, timeout=API_TIMEOUT
             )
 
@@ -573,20 +801,22 @@ class SnapmakerDevice:
                 self._status = "OFFLINE"
                 return
 
-            # Check if response is valid
-            if not response.text or response.text.strip() == "":
-                _LOGGER.error("Empty response from Snapmaker status API")
-                self._available = False
-                self._status = "OFFLINE"
-                return
-
             # Check for HTTP errors
             response.raise_for_status()
 
-            # Try to parse JSON
+            # An idle or finished printer keeps returning the same body. If
+            # _data still holds what was parsed from it, there is nothing to do.
+            payload = response.content
+            if (
+                payload == self._last_status_payload
+                and self._data is self._last_status_data
+            ):
+                return
+
+            # Parse the raw body; an empty response also raises JSONDecodeError
             try:
-                data = json.loads(response.text)
-            except json.JSONDecodeError as json_err:
+                data = orjson.loads(payload)
+            except orjson.JSONDecodeError as json_err:
                 _LOGGER.error(
                     "Invalid JSON response from Snapmaker: %s. Response text: %s",
                     json_err,
@@ -596,13 +826,24 @@ class SnapmakerDevice:
                 self._status = "OFFLINE"
                 return
 
+            if not isinstance(data, dict):
+                _LOGGER.error(
+                    "Unexpected status response from Snapmaker: %s",
+                    response.text[:200],
+                )
+                self._available = False
+                self._status = "OFFLINE"
+                return
+
             # Store the raw API response for diagnostic purposes
             self._raw_api_response = data
 
-            # Warn about any new keys that look sensitive but aren't in our filter set
-            for api_key in data:
-                if api_key not in SENSITIVE_API_KEYS and any(
-                    pattern in api_key.lower() for pattern in _SENSITIVE_KEY_PATTERNS
+            # Warn about any new keys that look sensitive but aren't in our filter
+            # set. The payload shape rarely changes, so each key is screened once.
+            for api_key in data.keys() - self._checked_api_keys:
+                self._checked_api_keys.add(api_key)
+                if api_key not in SENSITIVE_API_KEYS and _SENSITIVE_KEY_RE.search(
+                    api_key
                 ):
                     _LOGGER.warning(
                         "API response from %s contains potentially sensitive key '%s' "
@@ -611,12 +852,13 @@ class SnapmakerDevice:
                         api_key,
                     )
 
-            # Extract status data
-            status = data.get("status")
+            # Bind the lookups once; this block reads ~30 fields per poll
+            get = data.get
+            toolhead_name = TOOLHEAD_MAP.get
 
             # Determine toolhead type
-            raw_toolhead = data.get("toolHead", "")
-            tool_head = TOOLHEAD_MAP.get(raw_toolhead, raw_toolhead or "N/A")
+            raw_toolhead = get("toolHead", "")
+            tool_head = toolhead_name(raw_toolhead, raw_toolhead or "N/A")
 
             # Log unknown toolhead types for debugging
             if raw_toolhead and raw_toolhead not in TOOLHEAD_MAP:
@@ -659,190 +901,114 @@ class SnapmakerDevice:
             if tool_head and tool_head != "N/A":
                 self._toolhead_type = tool_head
 
-            # Extract temperature data based on configuration
-            if self._dual_extruder:
-                nozzle1_temp = data.get("nozzle1Temperature", 0)
-                nozzle1_target_temp = data.get("nozzle1TargetTemperature", 0)
-                nozzle2_temp = data.get("nozzle2Temperature", 0)
-                nozzle2_target_temp = data.get("nozzle2TargetTemperature", 0)
-            else:
-                # Single nozzle configuration
-                nozzle1_temp = data.get("nozzleTemperature", 0)
-                nozzle1_target_temp = data.get("nozzleTargetTemperature", 0)
-                nozzle2_temp = None
-                nozzle2_target_temp = None
-
-            bed_temp = data.get("heatedBedTemperature", 0)
-            bed_target_temp = data.get("heatedBedTargetTemperature", 0)
-
-            # Extract print job data
-            file_name = data.get("fileName", "N/A")
-            progress = 0
-            if data.get("progress") is not None:
-                progress = round(data.get("progress") * 100, 1)
-
-            elapsed_time = "00:00:00"
-            if data.get("elapsedTime") is not None:
-                elapsed_time = str(timedelta(seconds=data.get("elapsedTime")))
-
-            remaining_time = "00:00:00"
-            if data.get("remainingTime") is not None:
-                remaining_time = str(timedelta(seconds=data.get("remainingTime")))
-
-            estimated_time = "00:00:00"
-            if data.get("estimatedTime") is not None:
-                estimated_time = str(timedelta(seconds=data.get("estimatedTime")))
-
-            # Extract position data
-            x = data.get("x", 0)
-            y = data.get("y", 0)
-            z = data.get("z", 0)
-            homing = data.get("homing", "N/A")
-
-            # Extract module/safety data
-            is_filament_out = data.get("isFilamentOut", False)
-            is_door_open = data.get("isDoorOpen", False)
-            has_enclosure = data.get("enclosure", False)
-            has_rotary_module = data.get("rotaryModule", False)
-            has_emergency_stop = data.get("emergencyStop", False)
-            has_air_purifier = data.get("airPurifier", False)
-
-            # Extract G-code line progress
-            total_lines = data.get("totalLines", 0)
-            current_line = data.get("currentLine", 0)
-
-            # Extract CNC/Laser specific data
-            spindle_speed = data.get("spindleSpeed")
-            laser_power = data.get("laserPower")
-            laser_focal_length = data.get("laserFocalLength")
-
-            # Update device data
-            self._status = status
-            update_dict = {
-                "status": status,
-                "heated_bed_temperature": bed_temp,
-                "heated_bed_target_temperature": bed_target_temp,
-                "file_name": file_name,
-                "progress": progress,
-                "elapsed_time": elapsed_time,
-                "remaining_time": remaining_time,
-                "estimated_time": estimated_time,
-                "tool_head": tool_head,
-                "x": x,
-                "y": y,
-                "z": z,
-                "homing": homing,
-                "is_filament_out": is_filament_out,
-                "is_door_open": is_door_open,
-                "has_enclosure": has_enclosure,
-                "has_rotary_module": has_rotary_module,
-                "has_emergency_stop": has_emergency_stop,
-                "has_air_purifier": has_air_purifier,
-                "total_lines": total_lines,
-                "current_line": current_line,
-            }
-
-            # Add CNC/Laser specific data only when relevant
-            if spindle_speed is not None:
-                update_dict["spindle_speed"] = spindle_speed
-            if laser_power is not None:
-                update_dict["laser_power"] = laser_power
-            if laser_focal_length is not None:
-                update_dict["laser_focal_length"] = laser_focal_length
-
-            # Add nozzle data based on configuration
+            # Write straight into the device data: the plain fields, then the
+            # nozzle set for this configuration. The data dict outlives a
+            # single payload, so keys of the other nozzle layout are dropped.
+            fields = self._data
+            fields.update(
+                (dst, get(src, default)) for src, dst, default in _STATUS_FIELDS
+            )
             if self._dual_extruder:
-                update_dict.update(
-                    {
-                        "nozzle1_temperature": nozzle1_temp,
-                        "nozzle1_target_temperature": nozzle1_target_temp,
-                        "nozzle2_temperature": nozzle2_temp,
-                        "nozzle2_target_temperature": nozzle2_target_temp,
-                    }
-                )
+                nozzle_fields, stale_fields = _DUAL_NOZZLE_FIELDS, _SINGLE_NOZZLE_FIELDS
             else:
-                update_dict.update(
-                    {
-                        "nozzle_temperature": nozzle1_temp,
-                        "nozzle_target_temperature": nozzle1_target_temp,
-                    }
-                )
-
-            self._data.update(update_dict)
+                nozzle_fields, stale_fields = _SINGLE_NOZZLE_FIELDS, _DUAL_NOZZLE_FIELDS
+            fields.update(
+                (dst, get(src, default)) for src, dst, default in nozzle_fields
+            )
+            for _, dst, _ in stale_fields:
+                fields.pop(dst, None)
+
+            # Derived fields
+            fields["tool_head"] = tool_head
+            for src, dst, default, convert in _CONVERTED_FIELDS:
+                value = get(src)
+                fields[dst] = default if value is None else convert(value)
+
+            # Add CNC/Laser specific data only when relevant, and drop it
+            # again once the device stops reporting it
+            for src, dst in _OPTIONAL_FIELDS:
+                value = get(src)
+                if value is not None:
+                    fields[dst] = value
+                else:
+                    fields.pop(dst, None)
+
+            self._status = fields["status"]
+            self._last_status_payload = payload
+            self._last_status_data = self._data
         except requests.exceptions.HTTPError as http_err:
             # Note: 401 errors are already handled explicitly before raise_for_status()
             _LOGGER.error("HTTP error getting status from Snapmaker: %s", http_err)
             self._set_offline()
-        except Exception as err:
-            _LOGGER.error("Error getting status from Snapmaker: %s", err)
+        except requests.exceptions.RequestException as req_err:
+            _LOGGER.error("Network error getting status from Snapmaker: %s", req_err)
+            self._set_offline()
+        except (TypeError, ValueError, OverflowError) as err:
+            # The body parsed but a field has an unexpected shape or type, e.g.
+            # a string where a number was expected. Anything else is a bug and
+            # is left to surface through the coordinator.
+            _LOGGER.error("Unexpected status data from Snapmaker: %s", err)
             self._set_offline()
 
     @staticmethod
-    def discover() -> list:
-        """Discover Snapmaker devices on the network."""
-        devices = []
+    def discover(broadcast_addresses: Optional[Iterable[str]] = None) -> list:
+        """Discover Snapmaker devices on the network.
+
+        The discovery message is sent to every broadcast address up front and
+        replies are collected from all networks within a single SOCKET_TIMEOUT
+        window, so multi-homed hosts don't pay one timeout per interface.
+
+        Args:
+            broadcast_addresses: IPv4 broadcast addresses to probe, e.g. one
+                per enabled network interface. Defaults to the limited
+                broadcast address (255.255.255.255).
+
+        Returns:
+            list: Discovered devices, deduplicated by host.
+        """
+        devices: Dict[str, Dict[str, str]] = {}
         udp_socket = None
 
         try:
             # Create and configure socket inside try block to ensure cleanup
             udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
             udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            udp_socket.settimeout(SOCKET_TIMEOUT)
-            # Send discovery message to broadcast address
-            udp_socket.sendto(DISCOVER_MESSAGE, ("255.255.255.255", DISCOVER_PORT))
 
-            # Try to receive responses
-            try:
-                while True:
-                    reply, addr = udp_socket.recvfrom(BUFFER_SIZE)
+            # Send discovery message to every broadcast address before listening
+            for address in broadcast_addresses or (BROADCAST_ADDRESS,):
+                try:
+                    udp_socket.sendto(DISCOVER_MESSAGE, (address, DISCOVER_PORT))
+                except OSError as send_err:
+                    _LOGGER.debug(
+                        "Failed to send discovery broadcast to %s: %s",
+                        address,
+                        send_err,
+                    )
 
-                    # Parse response - decode bytes properly
-                    try:
-                        response_str = reply.decode("utf-8")
-                        elements = response_str.split("|")
-
-                        if len(elements) < 3:
-                            _LOGGER.warning(
-                                "Invalid discovery response format: %s", response_str
-                            )
-                            continue
-
-                        sn_ip = elements[0]
-                        sn_model = elements[1]
-                        sn_status = elements[2]
-
-                        # Parse fields with validation
-                        if (
-                            "@" not in sn_ip
-                            or ":" not in sn_model
-                            or ":" not in sn_status
-                        ):
-                            _LOGGER.warning(
-                                "Malformed discovery response: %s", response_str
-                            )
-                            continue
-
-                        # Split and discard prefix (e.g., "IP@" becomes "192.168.1.100")
-                        _prefix, sn_ip_val = sn_ip.split("@", 1)
-                        _prefix, sn_model_val = sn_model.split(":", 1)
-                        _prefix, sn_status_val = sn_status.split(":", 1)
-
-                        devices.append(
-                            {
-                                "host": sn_ip_val,
-                                "model": sn_model_val,
-                                "status": sn_status_val,
-                            }
-                        )
-                    except (UnicodeDecodeError, ValueError) as parse_err:
-                        _LOGGER.warning(
-                            "Failed to parse discovery response: %s", parse_err
-                        )
-                        continue
+            # Collect responses until the window closes. Each recvfrom only
+            # waits for what is left of it, so a steady trickle of replies
+            # can't keep the socket open past SOCKET_TIMEOUT.
+            deadline = time.monotonic() + SOCKET_TIMEOUT
+            while (remaining := deadline - time.monotonic()) > 0:
+                udp_socket.settimeout(remaining)
+                try:
+                    reply, addr = udp_socket.recvfrom(BUFFER_SIZE)
+                except socket.timeout:
+                    # No more responses
+                    break
 
-            except socket.timeout:
-                # No more responses
-                pass
+                parsed = _parse_discovery(reply, addr)
+                if parsed is None:
+                    continue
+                sn_ip_val, sn_model_val, sn_status_val = parsed
+
+                # A device reachable on several networks answers each
+                # broadcast, so keep one entry per host
+                devices[sn_ip_val] = {
+                    "host": sn_ip_val,
+                    "model": sn_model_val,
+                    "status": sn_status_val,
+                }
         except Exception as err:
             _LOGGER.error("Error discovering Snapmaker devices: %s", err)
         finally:
@@ -850,4 +1016,4 @@ class SnapmakerDevice:
             if udp_socket is not None:
                 udp_socket.close()
 
-        return devices
+        return list(devices.values())
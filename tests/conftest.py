@@ -1,15 +1,19 @@
 """Common fixtures for Snapmaker tests."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
 from homeassistant.const import CONF_HOST
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.snapmaker.const import DOMAIN
+from custom_components.snapmaker.snapmaker import SnapmakerDevice
 
 
 @pytest.fixture
 def mock_snapmaker_device():
     """Mock SnapmakerDevice in all import locations."""
-    device = MagicMock()
+    device = create_autospec(SnapmakerDevice, instance=True)
     device.host = "192.168.1.100"
     device.model = "Snapmaker A350"
     device.status = "IDLE"
@@ -53,6 +57,8 @@ def mock_snapmaker_device():
         "current_line": 0,
     }
     device.update.return_value = device.data
+    # Default: the user approves the connection on the touchscreen
+    device.generate_token.return_value = "test-token-123"
 
     # Patch where SnapmakerDevice is imported and used
     with (
@@ -64,6 +70,28 @@ def mock_snapmaker_device():
         yield mock_init
 
 
+class FakeCoordinator:
+    """Minimal stand-in for the DataUpdateCoordinator entities are bound to."""
+
+    def __init__(self, data):
+        """Initialize with the data the entities read."""
+        self.data = data
+        self.last_update_success = True
+
+    def async_add_listener(self, update_callback, context=None):
+        """Accept a listener and return a no-op unsubscribe callback."""
+        return lambda: None
+
+    async def async_request_refresh(self):
+        """Do nothing; tests drive data changes directly."""
+
+
+@pytest.fixture
+def mock_coordinator(mock_snapmaker_device):
+    """Create a fake coordinator serving the mock device's data."""
+    return FakeCoordinator(mock_snapmaker_device.return_value.data)
+
+
 @pytest.fixture
 def mock_discovery():
     """Mock SnapmakerDevice.discover."""
@@ -89,6 +117,8 @@ def mock_socket():
             b"IP@192.168.1.100|Model:Snapmaker A350|Status:IDLE",
             ("192.168.1.100", 20054),
         )
+        # Default: no late replies queued from an earlier poll
+        socket_instance.recv.side_effect = BlockingIOError
         # Default: TCP check succeeds
         socket_instance.connect_ex.return_value = 0
         mock.return_value = socket_instance
@@ -97,19 +127,20 @@ def mock_socket():
 
 @pytest.fixture
 def mock_requests():
-    """Mock requests for HTTP communication."""
+    """Mock the requests session used for HTTP communication."""
     import requests as real_requests
 
     with patch("custom_components.snapmaker.snapmaker.requests") as mock:
         # Preserve real exception classes so except clauses work
         mock.exceptions = real_requests.exceptions
+        session = mock.Session.return_value
         # Mock connect response
         connect_response = MagicMock()
-        connect_response.text = '{"token": "test-token-123"}'
+        connect_response.content = b'{"token": "test-token-123"}'
 
         # Mock status response with all fields
         status_response = MagicMock()
-        status_response.text = """{
+        status_response.content = b"""{
             "status": "IDLE",
             "toolHead": "TOOLHEAD_3DPRINTING_1",
             "nozzleTemperature": 25.0,
@@ -135,19 +166,60 @@ def mock_requests():
             "currentLine": 5000
         }"""
 
-        mock.post.return_value = connect_response
-        mock.get.return_value = status_response
-        yield mock
+        session.post.return_value = connect_response
+        session.get.return_value = status_response
+        yield session
 
 
 @pytest.fixture
-def config_entry_data():
-    """Return config entry data."""
-    return {CONF_HOST: "192.168.1.100"}
+def config_entry():
+    """Create a mock config entry."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Snapmaker",
+        data={CONF_HOST: "192.168.1.100"},
+        unique_id="192.168.1.100",
+    )
+
+
+@pytest.fixture
+def make_config_entry(hass):
+    """Return a factory adding a Snapmaker config entry to hass."""
+
+    def _make(host="192.168.1.100"):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title="Snapmaker",
+            data={CONF_HOST: host},
+            unique_id=host,
+        )
+        entry.add_to_hass(hass)
+        return entry
+
+    return _make
+
+
+@pytest.fixture
+def setup_hass_data(hass, mock_coordinator, mock_snapmaker_device):
+    """Return a helper storing the coordinator and device for an entry."""
+
+    def _install(entry):
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+            "coordinator": mock_coordinator,
+            "device": mock_snapmaker_device.return_value,
+        }
+
+    return _install
 
 
 # This fixture is automatically used by pytest-homeassistant-custom-component
 @pytest.fixture(autouse=True)
-def auto_enable_custom_integrations(enable_custom_integrations):
-    """Enable custom integrations for all tests."""
+def auto_enable_custom_integrations(request):
+    """Enable custom integrations for tests that run a hass instance.
+
+    enable_custom_integrations depends on hass, so requesting it
+    unconditionally would start Home Assistant for plain unit tests too.
+    """
+    if "hass" in request.fixturenames:
+        request.getfixturevalue("enable_custom_integrations")
     yield
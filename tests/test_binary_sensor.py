@@ -1,13 +1,8 @@
 """Tests for the Snapmaker binary sensor platform."""
 
-from unittest.mock import MagicMock
-
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.snapmaker.binary_sensor import (
     SnapmakerAirPurifierBinarySensor,
@@ -21,141 +16,106 @@ from custom_components.snapmaker.binary_sensor import (
 from custom_components.snapmaker.const import DOMAIN
 
 
-@pytest.fixture
-def mock_coordinator(mock_snapmaker_device):
-    """Create a mock coordinator."""
-    coordinator = MagicMock(spec=DataUpdateCoordinator)
-    coordinator.last_update_success = True
-    coordinator.data = mock_snapmaker_device.return_value.data
-    return coordinator
-
-
 class TestBinarySensorPlatform:
     """Test the binary sensor platform setup."""
 
     async def test_async_setup_entry(
-        self, hass: HomeAssistant, mock_coordinator, mock_snapmaker_device
+        self,
+        hass: HomeAssistant,
+        mock_snapmaker_device,
+        make_config_entry,
+        setup_hass_data,
     ):
         """Test binary sensor platform setup."""
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            title="Snapmaker",
-            data={CONF_HOST: "192.168.1.100"},
-            unique_id="192.168.1.100",
-        )
-        config_entry.add_to_hass(hass)
+        config_entry = make_config_entry()
 
-        hass.data[DOMAIN] = {
-            config_entry.entry_id: {
-                "coordinator": mock_coordinator,
-                "device": mock_snapmaker_device.return_value,
-            }
-        }
+        setup_hass_data(config_entry)
 
         entities = []
-
-        def mock_add_entities(new_entities):
-            entities.extend(new_entities)
-
-        await async_setup_entry(hass, config_entry, mock_add_entities)
+        await async_setup_entry(hass, config_entry, entities.extend)
 
         # 6 binary sensors
         assert len(entities) == 6
-        assert any(isinstance(e, SnapmakerFilamentOutBinarySensor) for e in entities)
-        assert any(isinstance(e, SnapmakerDoorOpenBinarySensor) for e in entities)
-        assert any(isinstance(e, SnapmakerEnclosureBinarySensor) for e in entities)
-        assert any(isinstance(e, SnapmakerRotaryModuleBinarySensor) for e in entities)
-        assert any(isinstance(e, SnapmakerEmergencyStopBinarySensor) for e in entities)
-        assert any(isinstance(e, SnapmakerAirPurifierBinarySensor) for e in entities)
+        assert {type(e) for e in entities} == {
+            SnapmakerFilamentOutBinarySensor,
+            SnapmakerDoorOpenBinarySensor,
+            SnapmakerEnclosureBinarySensor,
+            SnapmakerRotaryModuleBinarySensor,
+            SnapmakerEmergencyStopBinarySensor,
+            SnapmakerAirPurifierBinarySensor,
+        }
 
 
 class TestBinarySensorEntities:
     """Test individual binary sensor entities."""
 
-    def test_filament_out_sensor(self, mock_coordinator, mock_snapmaker_device):
-        """Test filament runout binary sensor."""
-        sensor = SnapmakerFilamentOutBinarySensor(
-            mock_coordinator, mock_snapmaker_device.return_value
-        )
-
-        assert sensor.name == "Filament Runout"
-        assert sensor.unique_id == "192.168.1.100_filament_out"
-        assert sensor._attr_device_class == BinarySensorDeviceClass.PROBLEM
-        assert sensor.is_on is False
-
-        # Test when filament is out
-        mock_snapmaker_device.return_value.data["is_filament_out"] = True
-        assert sensor.is_on is True
-
-    def test_door_open_sensor(self, mock_coordinator, mock_snapmaker_device):
-        """Test door open binary sensor."""
-        sensor = SnapmakerDoorOpenBinarySensor(
-            mock_coordinator, mock_snapmaker_device.return_value
-        )
-
-        assert sensor.name == "Door"
-        assert sensor.unique_id == "192.168.1.100_door_open"
-        assert sensor._attr_device_class == BinarySensorDeviceClass.DOOR
-        assert sensor.is_on is False
-
-        # Test when door is open
-        mock_snapmaker_device.return_value.data["is_door_open"] = True
-        assert sensor.is_on is True
-
-    def test_enclosure_sensor(self, mock_coordinator, mock_snapmaker_device):
-        """Test enclosure binary sensor."""
-        sensor = SnapmakerEnclosureBinarySensor(
-            mock_coordinator, mock_snapmaker_device.return_value
-        )
-
-        assert sensor.name == "Enclosure"
-        assert sensor.unique_id == "192.168.1.100_enclosure"
-        assert sensor._attr_device_class == BinarySensorDeviceClass.CONNECTIVITY
-        assert sensor.is_on is False
-
-        mock_snapmaker_device.return_value.data["has_enclosure"] = True
-        assert sensor.is_on is True
-
-    def test_rotary_module_sensor(self, mock_coordinator, mock_snapmaker_device):
-        """Test rotary module binary sensor."""
-        sensor = SnapmakerRotaryModuleBinarySensor(
-            mock_coordinator, mock_snapmaker_device.return_value
-        )
-
-        assert sensor.name == "Rotary Module"
-        assert sensor.unique_id == "192.168.1.100_rotary_module"
-        assert sensor._attr_device_class == BinarySensorDeviceClass.CONNECTIVITY
-        assert sensor.is_on is False
-
-        mock_snapmaker_device.return_value.data["has_rotary_module"] = True
-        assert sensor.is_on is True
-
-    def test_emergency_stop_sensor(self, mock_coordinator, mock_snapmaker_device):
-        """Test emergency stop binary sensor."""
-        sensor = SnapmakerEmergencyStopBinarySensor(
-            mock_coordinator, mock_snapmaker_device.return_value
-        )
-
-        assert sensor.name == "Emergency Stop Button"
-        assert sensor.unique_id == "192.168.1.100_emergency_stop"
-        assert sensor._attr_device_class == BinarySensorDeviceClass.SAFETY
-        assert sensor.is_on is False
-
-        mock_snapmaker_device.return_value.data["has_emergency_stop"] = True
-        assert sensor.is_on is True
-
-    def test_air_purifier_sensor(self, mock_coordinator, mock_snapmaker_device):
-        """Test air purifier binary sensor."""
-        sensor = SnapmakerAirPurifierBinarySensor(
-            mock_coordinator, mock_snapmaker_device.return_value
-        )
+    @pytest.mark.parametrize(
+        ("sensor_class", "name", "suffix", "device_class", "data_key"),
+        [
+            (
+                SnapmakerFilamentOutBinarySensor,
+                "Filament Runout",
+                "filament_out",
+                BinarySensorDeviceClass.PROBLEM,
+                "is_filament_out",
+            ),
+            (
+                SnapmakerDoorOpenBinarySensor,
+                "Door",
+                "door_open",
+                BinarySensorDeviceClass.DOOR,
+                "is_door_open",
+            ),
+            (
+                SnapmakerEnclosureBinarySensor,
+                "Enclosure",
+                "enclosure",
+                BinarySensorDeviceClass.CONNECTIVITY,
+                "has_enclosure",
+            ),
+            (
+                SnapmakerRotaryModuleBinarySensor,
+                "Rotary Module",
+                "rotary_module",
+                BinarySensorDeviceClass.CONNECTIVITY,
+                "has_rotary_module",
+            ),
+            (
+                SnapmakerEmergencyStopBinarySensor,
+                "Emergency Stop Button",
+                "emergency_stop",
+                BinarySensorDeviceClass.SAFETY,
+                "has_emergency_stop",
+            ),
+            (
+                SnapmakerAirPurifierBinarySensor,
+                "Air Purifier",
+                "air_purifier",
+                BinarySensorDeviceClass.CONNECTIVITY,
+                "has_air_purifier",
+            ),
+        ],
+    )
+    def test_binary_sensor(
+        self,
+        mock_coordinator,
+        mock_snapmaker_device,
+        monkeypatch,
+        sensor_class,
+        name,
+        suffix,
+        device_class,
+        data_key,
+    ):
+        """Test each binary sensor's identity and on/off state."""
+        sensor = sensor_class(mock_coordinator, mock_snapmaker_device.return_value)
 
-        assert sensor.name == "Air Purifier"
-        assert sensor.unique_id == "192.168.1.100_air_purifier"
-        assert sensor._attr_device_class == BinarySensorDeviceClass.CONNECTIVITY
+        assert sensor.name == name
+        assert sensor.unique_id == f"192.168.1.100_{suffix}"
+        assert sensor._attr_device_class == device_class
         assert sensor.is_on is False
 
-        mock_snapmaker_device.return_value.data["has_air_purifier"] = True
+        monkeypatch.setitem(mock_snapmaker_device.return_value.data, data_key, True)
         assert sensor.is_on is True
 
     def test_binary_sensor_availability(self, mock_coordinator, mock_snapmaker_device):
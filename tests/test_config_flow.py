@@ -1,57 +1,53 @@
 """Tests for the Snapmaker config flow."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
 from homeassistant.data_entry_flow import FlowResultType
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.snapmaker.const import CONF_TOKEN, DOMAIN
 
+# Discovery payloads for a printer at the default test address. The flow
+# only reads them, so tests share these instances.
+DHCP_INFO = SimpleNamespace(ip="192.168.1.100")
+DISCOVERY_INFO = {"host": "192.168.1.100", "model": "Snapmaker A350"}
 
-@pytest.fixture
-def mock_setup_entry():
-    """Mock setup entry."""
-    with patch(
-        "custom_components.snapmaker.async_setup_entry", return_value=True
-    ) as mock:
-        yield mock
 
+@pytest.fixture(autouse=True)
+def mock_setup_entry(monkeypatch):
+    """Keep flows that create an entry from setting up the integration."""
+    mock = AsyncMock(return_value=True)
+    monkeypatch.setattr("custom_components.snapmaker.async_setup_entry", mock)
+    return mock
 
-class TestConfigFlow:
-    """Test the config flow."""
-
-    async def test_user_flow_success(
-        self, hass, mock_snapmaker_device, mock_setup_entry
-    ):
-        """Test successful user configuration."""
-        # Mock generate_token to return a token
-        mock_snapmaker_device.return_value.generate_token.return_value = (
-            "test-token-123"
-        )
 
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
-
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "user"
+async def run_flow(hass, source, *step_inputs, init_data=None):
+    """Start a config flow and submit each step input in turn.
 
-        # Enter IP address - should proceed to authorize step
+    Returns:
+        The result of the last step.
+    """
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": source}, data=init_data
+    )
+    for user_input in step_inputs:
         result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {CONF_HOST: "192.168.1.100"},
+            result["flow_id"], user_input
         )
+    return result
 
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "authorize"
 
-        # Complete authorization - should create entry with token
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {},
+class TestConfigFlow:
+    """Test the config flow."""
+
+    async def test_user_flow_success(self, hass, mock_snapmaker_device):
+        """Test successful user configuration."""
+        # Enter IP address, then complete authorization
+        result = await run_flow(
+            hass, config_entries.SOURCE_USER, {CONF_HOST: "192.168.1.100"}, {}
         )
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
@@ -61,45 +57,35 @@ class TestConfigFlow:
             CONF_TOKEN: "test-token-123",
         }
 
-    async def test_user_flow_cannot_connect(
-        self, hass, mock_snapmaker_device, mock_setup_entry
-    ):
-        """Test user configuration with connection error."""
-        mock_snapmaker_device.return_value.available = False
-
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
-
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {CONF_HOST: "192.168.1.100"},
-        )
-
-        assert result["type"] == FlowResultType.FORM
-        assert result["errors"] == {"base": "cannot_connect"}
-
-    async def test_user_flow_exception(
-        self, hass, mock_snapmaker_device, mock_setup_entry
+    @pytest.mark.parametrize(
+        ("available", "update_error", "expected_error"),
+        [
+            (False, None, "cannot_connect"),
+            (True, Exception("Test error"), "unknown"),
+        ],
+    )
+    async def test_user_flow_errors(
+        self,
+        hass,
+        mock_snapmaker_device,
+        available,
+        update_error,
+        expected_error,
     ):
-        """Test user configuration with exception."""
-        mock_snapmaker_device.return_value.update.side_effect = Exception("Test error")
-
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
+        """Test user configuration when the device is offline or errors."""
+        device = mock_snapmaker_device.return_value
+        device.available = available
+        device.update.side_effect = update_error
 
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {CONF_HOST: "192.168.1.100"},
+        result = await run_flow(
+            hass, config_entries.SOURCE_USER, {CONF_HOST: "192.168.1.100"}
         )
 
         assert result["type"] == FlowResultType.FORM
-        assert result["errors"] == {"base": "unknown"}
+        assert result["errors"] == {"base": expected_error}
+        device.close.assert_called_once()
 
-    async def test_user_flow_auth_failed(
-        self, hass, mock_snapmaker_device, mock_setup_entry
-    ):
+    async def test_user_flow_auth_failed(self, hass, mock_snapmaker_device):
         """Test user configuration with authorization failure and retry."""
         # Mock generate_token to return None (failure)
         mock_snapmaker_device.return_value.generate_token.return_value = None
@@ -146,56 +132,24 @@ class TestConfigFlow:
         }
 
     async def test_user_flow_already_configured(
-        self, hass, mock_snapmaker_device, mock_setup_entry
+        self, hass, mock_snapmaker_device, make_config_entry
     ):
         """Test user configuration when device already configured."""
         # Create existing entry
-        config_entry = MockConfigEntry(
-            domain=DOMAIN,
-            title="Snapmaker",
-            data={CONF_HOST: "192.168.1.100"},
-            unique_id="192.168.1.100",
-        )
-        config_entry.add_to_hass(hass)
+        make_config_entry()
 
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN, context={"source": config_entries.SOURCE_USER}
-        )
-
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {CONF_HOST: "192.168.1.100"},
+        result = await run_flow(
+            hass, config_entries.SOURCE_USER, {CONF_HOST: "192.168.1.100"}
         )
 
         assert result["type"] == FlowResultType.ABORT
         assert result["reason"] == "already_configured"
 
-    async def test_dhcp_flow_success(
-        self, hass, mock_snapmaker_device, mock_setup_entry
-    ):
+    async def test_dhcp_flow_success(self, hass, mock_snapmaker_device):
         """Test DHCP discovery flow."""
-        # Mock generate_token to return a token
-        mock_snapmaker_device.return_value.generate_token.return_value = (
-            "test-token-123"
-        )
-
-        discovery_info = MagicMock()
-        discovery_info.ip = "192.168.1.100"
-
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": config_entries.SOURCE_DHCP},
-            data=discovery_info,
-        )
-
-        # Should proceed to authorize step
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "authorize"
-
-        # Complete authorization
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {},
+        # Device is online, so the flow goes straight to authorization
+        result = await run_flow(
+            hass, config_entries.SOURCE_DHCP, {}, init_data=DHCP_INFO
         )
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
@@ -205,81 +159,34 @@ class TestConfigFlow:
             CONF_TOKEN: "test-token-123",
         }
 
-    async def test_dhcp_flow_needs_confirmation(
-        self, hass, mock_snapmaker_device, mock_setup_entry
-    ):
+    async def test_dhcp_flow_needs_confirmation(self, hass, mock_snapmaker_device):
         """Test DHCP discovery that needs user confirmation."""
         mock_snapmaker_device.return_value.available = False
 
-        discovery_info = MagicMock()
-        discovery_info.ip = "192.168.1.100"
-
         result = await hass.config_entries.flow.async_init(
             DOMAIN,
             context={"source": config_entries.SOURCE_DHCP},
-            data=discovery_info,
+            data=DHCP_INFO,
         )
 
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "confirm"
 
-    async def test_confirm_flow_success(
-        self, hass, mock_snapmaker_device, mock_setup_entry
-    ):
+    async def test_confirm_flow_success(self, hass, mock_snapmaker_device):
         """Test confirmation flow success."""
-        # Mock generate_token to return a token
-        mock_snapmaker_device.return_value.generate_token.return_value = (
-            "test-token-123"
-        )
-
-        # Start with discovery which leads to confirm step
-        discovery_info = {
-            "host": "192.168.1.100",
-            "model": "Snapmaker A350",
-        }
-
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": "discovery"},
-            data=discovery_info,
-        )
-
-        # Should show confirm form
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "confirm"
-
-        # Confirm the setup - should proceed to authorize step
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {},
-        )
-
-        assert result["type"] == FlowResultType.FORM
-        assert result["step_id"] == "authorize"
-
-        # Complete authorization
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            {},
-        )
+        # Confirm the setup, then complete authorization
+        result = await run_flow(hass, "discovery", {}, {}, init_data=DISCOVERY_INFO)
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert result["title"] == "Snapmaker Snapmaker A350"
 
-    async def test_confirm_flow_cannot_connect(
-        self, hass, mock_snapmaker_device, mock_setup_entry
-    ):
+    async def test_confirm_flow_cannot_connect(self, hass, mock_snapmaker_device):
         """Test confirmation flow with connection error."""
         # Start with discovery which leads to confirm step
-        discovery_info = {
-            "host": "192.168.1.100",
-            "model": "Snapmaker A350",
-        }
-
         result = await hass.config_entries.flow.async_init(
             DOMAIN,
             context={"source": "discovery"},
-            data=discovery_info,
+            data=DISCOVERY_INFO,
         )
 
         # Should show confirm form
@@ -297,24 +204,19 @@ class TestConfigFlow:
         assert result["type"] == FlowResultType.FORM
         assert result["errors"] == {"base": "cannot_connect"}
 
-    async def test_discovery_flow(self, hass, mock_snapmaker_device, mock_setup_entry):
+    async def test_discovery_flow(self, hass, mock_snapmaker_device):
         """Test discovery flow."""
-        discovery_info = {
-            "host": "192.168.1.100",
-            "model": "Snapmaker A350",
-        }
-
         result = await hass.config_entries.flow.async_init(
             DOMAIN,
             context={"source": "discovery"},
-            data=discovery_info,
+            data=DISCOVERY_INFO,
         )
 
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "confirm"
         assert result["description_placeholders"] == {"host": "192.168.1.100"}
 
-    async def test_discovery_flow_no_data(self, hass, mock_setup_entry):
+    async def test_discovery_flow_no_data(self, hass):
         """Test discovery flow with no data."""
         result = await hass.config_entries.flow.async_init(
             DOMAIN,
@@ -326,38 +228,24 @@ class TestConfigFlow:
         assert result["reason"] == "not_snapmaker_device"
 
     async def test_pick_device_flow_success(
-        self, hass, mock_discovery, mock_snapmaker_device, mock_setup_entry
+        self, hass, mock_snapmaker_device, mock_discovery
     ):
         """Test pick device flow."""
-        # Mock generate_token to return a token
-        mock_snapmaker_device.return_value.generate_token.return_value = (
-            "test-token-123"
-        )
-
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": config_entries.SOURCE_USER},
-        )
-
-        # Navigate to pick_device step and verify its form is shown.
-        # Call async_step_pick_device directly on the flow instance to
-        # trigger device discovery (no direct path from the user step).
-        flow = hass.config_entries.flow._progress[result["flow_id"]]
-        result = await flow.async_step_pick_device()
+        # No user step leads to pick_device, so start the flow on it directly
+        result = await run_flow(hass, "pick_device")
 
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "pick_device"
 
-        # Complete pick_device - should proceed to authorize step
-        result = await flow.async_step_pick_device(
-            {"device": "192.168.1.100"},
+        # Pick the discovered device, then complete authorization
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"device": "192.168.1.100"}
         )
 
         assert result["type"] == FlowResultType.FORM
         assert result["step_id"] == "authorize"
 
-        # Complete authorization
-        result = await flow.async_step_authorize({})
+        result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
 
         assert result["type"] == FlowResultType.CREATE_ENTRY
         assert result["data"] == {
@@ -365,19 +253,11 @@ class TestConfigFlow:
             CONF_TOKEN: "test-token-123",
         }
 
-    async def test_pick_device_flow_no_devices(
-        self, hass, mock_discovery, mock_setup_entry
-    ):
+    async def test_pick_device_flow_no_devices(self, hass, mock_discovery):
         """Test pick device flow with no devices found."""
         mock_discovery.return_value = []
 
-        result = await hass.config_entries.flow.async_init(
-            DOMAIN,
-            context={"source": config_entries.SOURCE_USER},
-        )
-
-        flow = hass.config_entries.flow._progress[result["flow_id"]]
-        result = await flow.async_step_pick_device()
+        result = await run_flow(hass, "pick_device")
 
         assert result["type"] == FlowResultType.ABORT
         assert result["reason"] == "no_devices_found"
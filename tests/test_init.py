@@ -15,17 +15,6 @@ from custom_components.snapmaker import (
 from custom_components.snapmaker.const import CONF_TOKEN, DOMAIN
 
 
-@pytest.fixture
-def config_entry(config_entry_data):
-    """Create a mock config entry."""
-    return MockConfigEntry(
-        domain=DOMAIN,
-        title="Snapmaker",
-        data=config_entry_data,
-        unique_id="192.168.1.100",
-    )
-
-
 @pytest.fixture
 def mock_forward_setups():
     """Mock platform forward setup and unload to avoid state checks."""
@@ -41,13 +30,41 @@ def mock_forward_setups():
         yield mock_setup, mock_unload
 
 
+@pytest.fixture(autouse=True)
+async def init_domain(hass, request):
+    """Run the component setup that every config entry setup relies on.
+
+    Tests marked no_init_domain start from a hass without the component.
+    """
+    if request.node.get_closest_marker("no_init_domain") is None:
+        await async_setup(hass, {})
+
+
+@pytest.fixture
+async def setup_integration(
+    hass, config_entry, mock_snapmaker_device, mock_forward_setups
+):
+    """Set up the integration for config_entry and return its hass.data entry."""
+    config_entry.add_to_hass(hass)
+    await async_setup_entry(hass, config_entry)
+    return hass.data[DOMAIN][config_entry.entry_id]
+
+
 class TestInit:
     """Test the initialization."""
 
+    @pytest.mark.no_init_domain
     async def test_async_setup(self, hass: HomeAssistant):
         """Test the component setup."""
+        assert DOMAIN not in hass.data
+
         assert await async_setup(hass, {}) is True
-        assert DOMAIN in hass.data
+        assert hass.data[DOMAIN] == {}
+
+        # A repeat keeps existing entries
+        domain_data = hass.data[DOMAIN]
+        assert await async_setup(hass, {}) is True
+        assert hass.data[DOMAIN] is domain_data
 
     async def test_async_setup_entry(
         self,
@@ -57,8 +74,6 @@ class TestInit:
         mock_forward_setups,
     ):
         """Test setup from a config entry."""
-        # Initialize the integration first
-        await async_setup(hass, {})
         config_entry.add_to_hass(hass)
 
         result = await async_setup_entry(hass, config_entry)
@@ -71,17 +86,10 @@ class TestInit:
     async def test_async_setup_entry_creates_coordinator(
         self,
         hass: HomeAssistant,
-        config_entry,
-        mock_snapmaker_device,
-        mock_forward_setups,
+        setup_integration,
     ):
         """Test that setup creates a coordinator."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+        coordinator = setup_integration["coordinator"]
         assert coordinator is not None
         assert coordinator.name == "Snapmaker 192.168.1.100"
 
@@ -89,34 +97,27 @@ class TestInit:
         self,
         hass: HomeAssistant,
         config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test unloading a config entry."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
-        result = await async_unload_entry(hass, config_entry)
+        coordinator = setup_integration["coordinator"]
+        with patch.object(coordinator, "async_shutdown") as mock_shutdown:
+            result = await async_unload_entry(hass, config_entry)
 
         assert result is True
         assert config_entry.entry_id not in hass.data[DOMAIN]
+        mock_shutdown.assert_awaited_once()
+        mock_snapmaker_device.return_value.close.assert_called_once()
 
     async def test_coordinator_update(
         self,
         hass: HomeAssistant,
-        config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test coordinator update method."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+        coordinator = setup_integration["coordinator"]
         await coordinator.async_refresh()
 
         assert coordinator.last_update_success is True
@@ -125,20 +126,14 @@ class TestInit:
     async def test_coordinator_update_failure(
         self,
         hass: HomeAssistant,
-        config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test coordinator update with failure."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
         # Now set the side effect after setup
         mock_snapmaker_device.return_value.update.side_effect = Exception("Test error")
 
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+        coordinator = setup_integration["coordinator"]
         await coordinator.async_refresh()
 
         assert coordinator.last_update_success is False
@@ -146,33 +141,49 @@ class TestInit:
     async def test_coordinator_interval(
         self,
         hass: HomeAssistant,
-        config_entry,
-        mock_snapmaker_device,
-        mock_forward_setups,
+        setup_integration,
     ):
         """Test coordinator update interval is set correctly."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
+        coordinator = setup_integration["coordinator"]
+        assert coordinator.update_interval.total_seconds() == 30
 
-        await async_setup_entry(hass, config_entry)
+    async def test_coordinator_backs_off_while_idle(
+        self,
+        hass: HomeAssistant,
+        setup_integration,
+    ):
+        """Test that an idle printer is polled less often, up to the maximum."""
+        coordinator = setup_integration["coordinator"]
+        intervals = []
+        for _ in range(4):
+            await coordinator.async_refresh()
+            intervals.append(coordinator.update_interval.total_seconds())
 
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-        assert coordinator.update_interval.total_seconds() == 30
+        assert intervals == [60, 120, 120, 120]
 
-    async def test_device_stored_in_hass_data(
+    async def test_coordinator_interval_resets_on_status_change(
         self,
         hass: HomeAssistant,
-        config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
-        """Test that device instance is stored in hass.data."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
+        """Test that a status change restores the base polling interval."""
+        coordinator = setup_integration["coordinator"]
+        await coordinator.async_refresh()
+        assert coordinator.update_interval.total_seconds() == 60
 
-        await async_setup_entry(hass, config_entry)
+        mock_snapmaker_device.return_value.status = "RUNNING"
+        await coordinator.async_refresh()
+
+        assert coordinator.update_interval.total_seconds() == 30
 
-        device = hass.data[DOMAIN][config_entry.entry_id]["device"]
+    async def test_device_stored_in_hass_data(
+        self,
+        hass: HomeAssistant,
+        setup_integration,
+    ):
+        """Test that device instance is stored in hass.data."""
+        device = setup_integration["device"]
         assert device is not None
         assert device.host == "192.168.1.100"
 
@@ -190,59 +201,42 @@ class TestTokenPersistence:
             data={CONF_HOST: "192.168.1.100", CONF_TOKEN: "saved-token-abc"},
             unique_id="192.168.1.100",
         )
-        await async_setup(hass, {})
         config_entry.add_to_hass(hass)
 
         await async_setup_entry(hass, config_entry)
 
         # Verify SnapmakerDevice was created with the saved token
-        mock_snapmaker_device.assert_any_call("192.168.1.100", token="saved-token-abc")
+        mock_snapmaker_device.assert_called_once_with(
+            "192.168.1.100", token="saved-token-abc"
+        )
 
     async def test_setup_without_token(
         self,
         hass: HomeAssistant,
-        config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test that setup works without a saved token."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
         # Verify SnapmakerDevice was created with token=None
-        mock_snapmaker_device.assert_any_call("192.168.1.100", token=None)
+        mock_snapmaker_device.assert_called_once_with("192.168.1.100", token=None)
 
     async def test_token_callback_is_set(
         self,
         hass: HomeAssistant,
-        config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test that the token update callback is set on the device."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
         # Verify set_token_update_callback was called
         mock_snapmaker_device.return_value.set_token_update_callback.assert_called()
 
     async def test_token_callback_uses_call_soon_threadsafe(
         self,
         hass: HomeAssistant,
-        config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test that the token callback uses call_soon_threadsafe for thread safety."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
         # Get the callback that was registered
         call_args = (
             mock_snapmaker_device.return_value.set_token_update_callback.call_args
@@ -256,15 +250,10 @@ class TestTokenPersistence:
         self,
         hass: HomeAssistant,
         config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test that token callback actually updates the config entry."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
         # Get the callback that was registered
         call_args = (
             mock_snapmaker_device.return_value.set_token_update_callback.call_args
@@ -284,16 +273,10 @@ class TestTokenPersistence:
     async def test_token_callback_logs_update(
         self,
         hass: HomeAssistant,
-        config_entry,
+        setup_integration,
         mock_snapmaker_device,
-        mock_forward_setups,
     ):
         """Test that token callback logs the update."""
-        await async_setup(hass, {})
-        config_entry.add_to_hass(hass)
-
-        await async_setup_entry(hass, config_entry)
-
         # Get the callback that was registered
         call_args = (
             mock_snapmaker_device.return_value.set_token_update_callback.call_args
@@ -322,7 +305,6 @@ class TestReauthFlow:
             data={CONF_HOST: "192.168.1.100", CONF_TOKEN: "old-token"},
             unique_id="192.168.1.100",
         )
-        await async_setup(hass, {})
         config_entry.add_to_hass(hass)
 
         await async_setup_entry(hass, config_entry)
@@ -351,7 +333,6 @@ class TestReauthFlow:
             data={CONF_HOST: "192.168.1.100", CONF_TOKEN: "old-token"},
             unique_id="192.168.1.100",
         )
-        await async_setup(hass, {})
         config_entry.add_to_hass(hass)
 
         await async_setup_entry(hass, config_entry)
@@ -382,7 +363,6 @@ class TestReauthFlow:
             data={CONF_HOST: "192.168.1.100"},  # No token
             unique_id="192.168.1.100",
         )
-        await async_setup(hass, {})
         config_entry.add_to_hass(hass)
 
         # Mock device to return token_invalid=True when no token is present
@@ -397,6 +377,9 @@ class TestReauthFlow:
             # Verify reauth was triggered before the exception
             mock_reauth.assert_called_once_with(hass)
 
+        # The failed setup releases the device it created
+        mock_snapmaker_device.return_value.close.assert_called_once()
+
     async def test_token_invalidation_after_successful_updates(
         self, hass: HomeAssistant, mock_snapmaker_device, mock_forward_setups
     ):
@@ -407,7 +390,6 @@ class TestReauthFlow:
             data={CONF_HOST: "192.168.1.100", CONF_TOKEN: "valid-token"},
             unique_id="192.168.1.100",
         )
-        await async_setup(hass, {})
         config_entry.add_to_hass(hass)
 
         # Initially token is valid
@@ -1,11 +1,7 @@
 """Tests for the Snapmaker sensor platform."""
 
-from unittest.mock import MagicMock
-
 from homeassistant.const import CONF_HOST, PERCENTAGE, UnitOfLength, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.snapmaker.const import (
@@ -44,31 +40,14 @@ from custom_components.snapmaker.sensor import (
 )
 
 
-@pytest.fixture
-def mock_coordinator(mock_snapmaker_device):
-    """Create a mock coordinator."""
-    coordinator = MagicMock(spec=DataUpdateCoordinator)
-    coordinator.last_update_success = True
-    coordinator.data = mock_snapmaker_device.return_value.data
-    return coordinator
-
-
-@pytest.fixture
-def config_entry(config_entry_data):
-    """Create a mock config entry."""
-    return MockConfigEntry(
-        domain=DOMAIN,
-        title="Snapmaker",
-        data=config_entry_data,
-        unique_id="192.168.1.100",
-    )
-
-
 class TestSensorPlatform:
     """Test the sensor platform setup."""
 
     async def test_async_setup_entry_single_extruder(
-        self, hass: HomeAssistant, mock_coordinator, mock_snapmaker_device
+        self,
+        hass: HomeAssistant,
+        mock_snapmaker_device,
+        setup_hass_data,
     ):
         """Test sensor platform setup for single extruder."""
         config_entry = MockConfigEntry(
@@ -80,19 +59,10 @@ class TestSensorPlatform:
         config_entry.add_to_hass(hass)
 
         mock_snapmaker_device.return_value.dual_extruder = False
-        hass.data[DOMAIN] = {
-            config_entry.entry_id: {
-                "coordinator": mock_coordinator,
-                "device": mock_snapmaker_device.return_value,
-            }
-        }
+        setup_hass_data(config_entry)
 
         entities = []
-
-        def mock_add_entities(new_entities):
-            entities.extend(new_entities)
-
-        await async_setup_entry(hass, config_entry, mock_add_entities)
+        await async_setup_entry(hass, config_entry, entities.extend)
 
         # 16 common sensors + 2 single nozzle sensors = 18
         # (CNC/Laser sensors are only added for matching toolhead types)
@@ -112,7 +82,10 @@ class TestSensorPlatform:
         assert not any(isinstance(e, SnapmakerLaserFocalLengthSensor) for e in entities)
 
     async def test_async_setup_entry_dual_extruder(
-        self, hass: HomeAssistant, mock_coordinator, mock_snapmaker_device
+        self,
+        hass: HomeAssistant,
+        mock_snapmaker_device,
+        setup_hass_data,
     ):
         """Test sensor platform setup for dual extruder."""
         config_entry = MockConfigEntry(
@@ -124,19 +97,10 @@ class TestSensorPlatform:
         config_entry.add_to_hass(hass)
 
         mock_snapmaker_device.return_value.dual_extruder = True
-        hass.data[DOMAIN] = {
-            config_entry.entry_id: {
-                "coordinator": mock_coordinator,
-                "device": mock_snapmaker_device.return_value,
-            }
-        }
+        setup_hass_data(config_entry)
 
         entities = []
-
-        def mock_add_entities(new_entities):
-            entities.extend(new_entities)
-
-        await async_setup_entry(hass, config_entry, mock_add_entities)
+        await async_setup_entry(hass, config_entry, entities.extend)
 
         # 16 common sensors + 4 dual nozzle sensors = 20
         assert len(entities) == 20
@@ -144,7 +108,10 @@ class TestSensorPlatform:
         assert any(isinstance(e, SnapmakerNozzle2TempSensor) for e in entities)
 
     async def test_async_setup_entry_cnc_toolhead(
-        self, hass: HomeAssistant, mock_coordinator, mock_snapmaker_device
+        self,
+        hass: HomeAssistant,
+        mock_snapmaker_device,
+        setup_hass_data,
     ):
         """Test sensor platform setup for CNC toolhead."""
         config_entry = MockConfigEntry(
@@ -157,12 +124,7 @@ class TestSensorPlatform:
 
         mock_snapmaker_device.return_value.dual_extruder = False
         mock_snapmaker_device.return_value.toolhead_type = "CNC"
-        hass.data[DOMAIN] = {
-            config_entry.entry_id: {
-                "coordinator": mock_coordinator,
-                "device": mock_snapmaker_device.return_value,
-            }
-        }
+        setup_hass_data(config_entry)
 
         entities = []
         await async_setup_entry(hass, config_entry, entities.extend)
@@ -174,7 +136,10 @@ class TestSensorPlatform:
         assert not any(isinstance(e, SnapmakerLaserFocalLengthSensor) for e in entities)
 
     async def test_async_setup_entry_laser_toolhead(
-        self, hass: HomeAssistant, mock_coordinator, mock_snapmaker_device
+        self,
+        hass: HomeAssistant,
+        mock_snapmaker_device,
+        setup_hass_data,
     ):
         """Test sensor platform setup for Laser toolhead."""
         config_entry = MockConfigEntry(
@@ -187,12 +152,7 @@ class TestSensorPlatform:
 
         mock_snapmaker_device.return_value.dual_extruder = False
         mock_snapmaker_device.return_value.toolhead_type = "Laser"
-        hass.data[DOMAIN] = {
-            config_entry.entry_id: {
-                "coordinator": mock_coordinator,
-                "device": mock_snapmaker_device.return_value,
-            }
-        }
+        setup_hass_data(config_entry)
 
         entities = []
         await async_setup_entry(hass, config_entry, entities.extend)
@@ -204,7 +164,10 @@ class TestSensorPlatform:
         assert any(isinstance(e, SnapmakerLaserFocalLengthSensor) for e in entities)
 
     async def test_async_setup_entry_unknown_toolhead(
-        self, hass: HomeAssistant, mock_coordinator, mock_snapmaker_device
+        self,
+        hass: HomeAssistant,
+        mock_snapmaker_device,
+        setup_hass_data,
     ):
         """Test sensor platform setup with unknown/None toolhead type."""
         config_entry = MockConfigEntry(
@@ -217,12 +180,7 @@ class TestSensorPlatform:
 
         mock_snapmaker_device.return_value.dual_extruder = False
         mock_snapmaker_device.return_value.toolhead_type = None
-        hass.data[DOMAIN] = {
-            config_entry.entry_id: {
-                "coordinator": mock_coordinator,
-                "device": mock_snapmaker_device.return_value,
-            }
-        }
+        setup_hass_data(config_entry)
 
         entities = []
         await async_setup_entry(hass, config_entry, entities.extend)
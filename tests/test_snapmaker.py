@@ -1,15 +1,22 @@
 """Tests for the Snapmaker device module."""
 
 import socket
+import time
 from unittest.mock import MagicMock, call, patch
 
+import orjson
+import pytest
 import requests
 
 from custom_components.snapmaker.snapmaker import (
     API_PORT,
+    DISCOVERY_LISTEN_WINDOWS,
     REACHABILITY_MAX_RETRIES,
     SENSITIVE_API_KEYS,
+    TOKEN_RETRY_INTERVAL,
     SnapmakerDevice,
+    _format_duration,
+    _parse_discovery,
 )
 
 
@@ -28,6 +35,13 @@ class TestSnapmakerDevice:
         assert device.token is None
         assert device.raw_api_response == {}
 
+    def test_init_uses_slots(self):
+        """Test that device instances carry no per-instance __dict__."""
+        device = SnapmakerDevice("192.168.1.100")
+        assert not hasattr(device, "__dict__")
+        with pytest.raises(AttributeError):
+            device.unexpected = True
+
     def test_init_with_token(self):
         """Test device initialization with a persisted token."""
         device = SnapmakerDevice("192.168.1.100", token="saved-token-456")
@@ -74,8 +88,10 @@ class TestSnapmakerDevice:
         assert device.status == "IDLE"
         assert device.data["ip"] == "192.168.1.100"
 
-        # Verify broadcast message was sent with correct arguments
-        mock_socket.sendto.assert_called_with(b"discover", ("255.255.255.255", 20054))
+        # Verify discovery message was sent to the known host only
+        mock_socket.sendto.assert_called_once_with(
+            b"discover", ("192.168.1.100", 20054)
+        )
 
     def test_check_online_filters_wrong_device(self, mock_socket):
         """Test that _check_online filters responses from wrong devices."""
@@ -98,6 +114,26 @@ class TestSnapmakerDevice:
         assert device.model == "Snapmaker A350"
         assert device.data["ip"] == "192.168.1.100"
 
+    def test_check_online_skips_unrelated_replies_unparsed(self, mock_socket):
+        """Test that replies from other hosts are dropped before parsing."""
+        mock_socket.recvfrom.side_effect = [
+            (b"SSDP noise", ("192.168.1.50", 20054)),
+            (
+                b"IP@192.168.1.100|Model:Snapmaker A350|Status:IDLE",
+                ("192.168.1.100", 20054),
+            ),
+        ]
+
+        device = SnapmakerDevice("192.168.1.100")
+        with patch(
+            "custom_components.snapmaker.snapmaker._parse_discovery",
+            wraps=_parse_discovery,
+        ) as mock_parse:
+            device._check_online()
+
+        assert device.available is True
+        mock_parse.assert_called_once()
+
     def test_check_online_timeout(self, mock_socket):
         """Test device discovery timeout."""
         mock_socket.recvfrom.side_effect = socket.timeout()
@@ -107,8 +143,28 @@ class TestSnapmakerDevice:
 
         assert device.available is False
         assert device.status == "OFFLINE"
-        # Should retry MAX_RETRIES times
-        assert mock_socket.sendto.call_count == 5
+        # One broadcast plus a single resend
+        assert mock_socket.sendto.call_count == len(DISCOVERY_LISTEN_WINDOWS)
+
+    def test_check_online_found_on_resend(self, mock_socket):
+        """Test that the broadcast resend finds a device that missed the probe."""
+        mock_socket.recvfrom.side_effect = [
+            socket.timeout(),
+            (
+                b"IP@192.168.1.100|Model:Snapmaker A350|Status:IDLE",
+                ("192.168.1.100", 20054),
+            ),
+        ]
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._check_online()
+
+        assert device.available is True
+        # The resend falls back to broadcast in case unicast is being dropped
+        assert mock_socket.sendto.call_args_list == [
+            call(b"discover", ("192.168.1.100", 20054)),
+            call(b"discover", ("255.255.255.255", 20054)),
+        ]
 
     def test_get_token_success(self, mock_requests):
         """Test successful token retrieval."""
@@ -131,22 +187,78 @@ class TestSnapmakerDevice:
 
     def test_get_token_failure(self, mock_requests):
         """Test token retrieval failure."""
-        mock_requests.post.return_value.text = '{"error": "Failed"}'
+        mock_requests.post.return_value.content = b'{"error": "Failed"}'
+
+        device = SnapmakerDevice("192.168.1.100")
+        token = device._get_token()
+
+        assert token is None
+
+    def test_get_token_validation_http_error(self, mock_requests):
+        """Test that an HTTP error on token validation skips parsing."""
+        first = MagicMock(content=b'{"token": "test-token-123"}')
+        # Even a body echoing the token must not be trusted on an error status
+        second = MagicMock(content=b'{"token": "test-token-123"}')
+        second.raise_for_status.side_effect = requests.exceptions.HTTPError("500")
+        mock_requests.post.side_effect = [first, second]
 
         device = SnapmakerDevice("192.168.1.100")
         token = device._get_token()
 
         assert token is None
+        assert device.token_invalid is False
 
     def test_get_token_no_token_in_response(self, mock_requests):
         """Test token retrieval when no token in response."""
-        mock_requests.post.return_value.text = "{}"
+        mock_requests.post.return_value.content = b"{}"
 
         device = SnapmakerDevice("192.168.1.100")
         token = device._get_token()
 
         assert token is None
 
+    def test_update_backs_off_failed_token_handshake(self, mock_socket, mock_requests):
+        """Test that a refused handshake is not repeated on every poll."""
+        mock_requests.post.return_value.content = b"{}"
+
+        device = SnapmakerDevice("192.168.1.100")
+        device.update()
+        device.update()
+
+        # Only the first poll tried the handshake
+        assert mock_requests.post.call_count == 1
+        assert device.available is True
+
+        with patch(
+            "custom_components.snapmaker.snapmaker.time.monotonic",
+            return_value=time.monotonic() + TOKEN_RETRY_INTERVAL,
+        ):
+            device.update()
+
+        assert mock_requests.post.call_count == 2
+
+    def test_update_retries_token_handshake_after_reconnect(
+        self, mock_socket, mock_requests
+    ):
+        """Test that a device coming back online retries the handshake at once."""
+        mock_requests.post.return_value.content = b"{}"
+
+        device = SnapmakerDevice("192.168.1.100")
+        device.update()
+        assert device.token is None
+
+        # The device drops off the network, then returns after being approved
+        mock_socket.recvfrom.side_effect = socket.timeout
+        device.update()
+        assert device.available is False
+
+        mock_socket.recvfrom.side_effect = None
+        mock_requests.post.return_value.content = b'{"token": "test-token-123"}'
+        device.update()
+
+        assert device.token == "test-token-123"
+        assert mock_requests.post.call_count == 3
+
     def test_get_status_single_extruder(self, mock_requests):
         """Test status retrieval for single extruder device."""
         device = SnapmakerDevice("192.168.1.100")
@@ -208,8 +320,8 @@ class TestSnapmakerDevice:
         ]
 
         for raw_toolhead, expected_name in test_cases:
-            mock_requests.get.return_value.text = (
-                f'{{"status": "IDLE", "toolHead": "{raw_toolhead}"}}'
+            mock_requests.get.return_value.content = (
+                f'{{"status": "IDLE", "toolHead": "{raw_toolhead}"}}'.encode()
             )
             device = SnapmakerDevice("192.168.1.100")
             device._token = "test-token-123"
@@ -221,7 +333,7 @@ class TestSnapmakerDevice:
 
     def test_get_status_dual_extruder_detection_via_toolhead(self, mock_requests):
         """Test dual extruder detection when toolhead is 3D printing but no single nozzle temp."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "IDLE",
             "toolHead": "TOOLHEAD_3DPRINTING_1",
             "nozzle1Temperature": 200.0,
@@ -242,7 +354,7 @@ class TestSnapmakerDevice:
 
     def test_get_status_cnc_laser_fields(self, mock_requests):
         """Test CNC and laser specific fields are parsed."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "RUNNING",
             "toolHead": "TOOLHEAD_CNC_1",
             "spindleSpeed": 12000,
@@ -260,7 +372,7 @@ class TestSnapmakerDevice:
 
     def test_get_status_laser_fields(self, mock_requests):
         """Test laser specific fields are parsed."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "RUNNING",
             "toolHead": "TOOLHEAD_LASER_1",
             "laserPower": 100,
@@ -293,7 +405,7 @@ class TestSnapmakerDevice:
 
     def test_get_status_raw_api_response_filters_sensitive_keys(self, mock_requests):
         """Test that sensitive keys are filtered from raw API response."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "IDLE",
             "token": "secret-token-value",
             "nozzleTemperature": 25.0
@@ -319,7 +431,7 @@ class TestSnapmakerDevice:
 
     def test_get_status_dual_extruder(self, mock_requests):
         """Test status retrieval for dual extruder device."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "RUNNING",
             "nozzle1Temperature": 200.0,
             "nozzle1TargetTemperature": 210.0,
@@ -348,7 +460,7 @@ class TestSnapmakerDevice:
 
     def test_get_status_empty_response(self, mock_requests):
         """Test status retrieval with empty response."""
-        mock_requests.get.return_value.text = ""
+        mock_requests.get.return_value.content = b""
 
         device = SnapmakerDevice("192.168.1.100")
         device._token = "test-token-123"
@@ -360,7 +472,7 @@ class TestSnapmakerDevice:
 
     def test_get_status_invalid_json(self, mock_requests):
         """Test status retrieval with invalid JSON."""
-        mock_requests.get.return_value.text = "invalid json {"
+        mock_requests.get.return_value.content = b"invalid json {"
 
         device = SnapmakerDevice("192.168.1.100")
         device._token = "test-token-123"
@@ -378,7 +490,8 @@ class TestSnapmakerDevice:
             error = requests.exceptions.HTTPError("HTTP Error")
             error.response = MagicMock()
             error.response.status_code = 500
-            mock_req.get.return_value.raise_for_status.side_effect = error
+            response = mock_req.Session.return_value.get.return_value
+            response.raise_for_status.side_effect = error
 
             device = SnapmakerDevice("192.168.1.100")
             device._token = "test-token-123"
@@ -397,8 +510,9 @@ class TestSnapmakerDevice:
             error.response = MagicMock()
             error.response.status_code = 401
             # Set status_code on the mock response object itself (not just on error.response)
-            mock_req.get.return_value.status_code = 401
-            mock_req.get.return_value.raise_for_status.side_effect = error
+            response = mock_req.Session.return_value.get.return_value
+            response.status_code = 401
+            response.raise_for_status.side_effect = error
 
             device = SnapmakerDevice("192.168.1.100")
             device._token = "test-token-123"
@@ -413,8 +527,8 @@ class TestSnapmakerDevice:
 
     def test_get_status_unknown_toolhead_logs_warning(self, mock_requests):
         """Test that unknown toolhead types are logged."""
-        mock_requests.get.return_value.text = (
-            '{"status": "IDLE", "toolHead": "TOOLHEAD_FUTURE_V3"}'
+        mock_requests.get.return_value.content = (
+            b'{"status": "IDLE", "toolHead": "TOOLHEAD_FUTURE_V3"}'
         )
 
         device = SnapmakerDevice("192.168.1.100")
@@ -457,6 +571,56 @@ class TestSnapmakerDevice:
 
         assert len(devices) == 0
 
+    def test_discover_multiple_broadcast_addresses(self, mock_socket):
+        """Test discover probes every broadcast address before listening."""
+        mock_socket.recvfrom.side_effect = [
+            (
+                b"IP@192.168.1.100|Model:Snapmaker A350|Status:IDLE",
+                ("192.168.1.100", 20054),
+            ),
+            (
+                b"IP@10.0.0.5|Model:Snapmaker A250|Status:IDLE",
+                ("10.0.0.5", 20054),
+            ),
+            socket.timeout(),
+        ]
+
+        devices = SnapmakerDevice.discover(["192.168.1.255", "10.0.0.255"])
+
+        assert mock_socket.sendto.call_args_list == [
+            call(b"discover", ("192.168.1.255", 20054)),
+            call(b"discover", ("10.0.0.255", 20054)),
+        ]
+        assert [device["host"] for device in devices] == [
+            "192.168.1.100",
+            "10.0.0.5",
+        ]
+
+    def test_discover_deduplicates_hosts(self, mock_socket):
+        """Test a device answering on several networks is only listed once."""
+        reply = (
+            b"IP@192.168.1.100|Model:Snapmaker A350|Status:IDLE",
+            ("192.168.1.100", 20054),
+        )
+        mock_socket.recvfrom.side_effect = [reply, reply, socket.timeout()]
+
+        devices = SnapmakerDevice.discover(["192.168.1.255", "255.255.255.255"])
+
+        assert len(devices) == 1
+        assert devices[0]["host"] == "192.168.1.100"
+
+    def test_discover_bounded_by_listen_window(self, mock_socket):
+        """Test that a stream of replies can't extend the listen window."""
+        with patch(
+            "custom_components.snapmaker.snapmaker.time.monotonic",
+            side_effect=[0.0, 0.1, 0.3, 0.6],
+        ):
+            devices = SnapmakerDevice.discover()
+
+        # Window closed after two replies even though more kept arriving
+        assert mock_socket.recvfrom.call_count == 2
+        assert len(devices) == 1
+
     def test_discover_exception(self):
         """Test discover with exception."""
         with patch(
@@ -496,6 +660,153 @@ class TestSnapmakerDevice:
         assert device.data["is_filament_out"] is False
         assert device.raw_api_response == {}
 
+    def test_get_status_network_error_sets_offline(self, mock_requests):
+        """Test that a request failure marks the device offline."""
+        mock_requests.get.side_effect = requests.exceptions.Timeout("timed out")
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+        device._get_status()
+
+        assert device.available is False
+        assert device.status == "OFFLINE"
+
+    def test_get_status_unexpected_field_type_sets_offline(self, mock_requests):
+        """Test that a field with the wrong type marks the device offline."""
+        mock_requests.get.return_value.content = b'{"status": "IDLE", "progress": "x"}'
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+        device._get_status()
+
+        assert device.available is False
+        assert device.status == "OFFLINE"
+
+    def test_get_status_non_object_body_sets_offline(self, mock_requests):
+        """Test that a JSON body that is not an object marks the device offline."""
+        mock_requests.get.return_value.content = b'["IDLE"]'
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+        device._get_status()
+
+        assert device.available is False
+        assert device.status == "OFFLINE"
+
+    def test_get_status_propagates_unexpected_errors(self, mock_requests):
+        """Test that programming errors are not swallowed."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+
+        broken = MagicMock(side_effect=RuntimeError("bug"))
+        with (
+            patch(
+                "custom_components.snapmaker.snapmaker._CONVERTED_FIELDS",
+                (("progress", "progress", 0, broken),),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            device._get_status()
+
+    def test_get_status_data_is_json_native(self, mock_requests):
+        """Test that status data holds only JSON-native values."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+
+        device._get_status()
+
+        for key, value in device.data.items():
+            assert type(value) in (str, int, float, bool, type(None)), key
+
+        # A whole progress fraction arrives from the JSON as an int
+        mock_requests.get.return_value.content = b'{"status": "IDLE", "progress": 1}'
+        device._get_status()
+
+        assert isinstance(device.data["progress"], float)
+        assert device.data["progress"] == 100.0
+
+    def test_get_status_updates_data_in_place(self, mock_requests):
+        """Test that status updates write into the existing data dict."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+        data = device.data
+
+        device._get_status()
+
+        assert device.data is data
+        assert data["status"] == "IDLE"
+
+    def test_get_status_skips_unchanged_payload(self, mock_requests):
+        """Test that an identical status body is not parsed again."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+
+        with patch(
+            "custom_components.snapmaker.snapmaker.orjson.loads",
+            wraps=orjson.loads,
+        ) as mock_loads:
+            device._get_status()
+            device._get_status()
+
+        mock_loads.assert_called_once()
+        assert device.data["status"] == "IDLE"
+
+    def test_get_status_reparses_after_data_replaced(self, mock_socket, mock_requests):
+        """Test that the same body is applied again once discovery reset data."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+        device._get_status()
+
+        device._check_online()
+        assert "nozzle_temperature" not in device.data
+        device._get_status()
+
+        assert "nozzle_temperature" in device.data
+
+    def test_set_offline_reuses_data_while_offline(self):
+        """Test that repeated _set_offline calls keep the same offline data."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._set_offline()
+        offline_data = device.data
+
+        device._set_offline()
+
+        assert device.data is offline_data
+
+    def test_set_offline_rebuilds_after_going_online(self, mock_socket):
+        """Test that offline data is rebuilt once the device was online again."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._set_offline()
+        offline_data = device.data
+
+        device._check_online()
+        assert device.available is True
+        device._set_offline()
+
+        assert device.data is not offline_data
+        assert device.data["model"] == "Snapmaker A350"
+
+    def test_offline_and_online_data_share_keys(self, mock_requests):
+        """Test that going offline keeps the same keys as a status update."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+        device._data = {"ip": "192.168.1.100", "model": "Snapmaker A350"}
+        device._get_status()
+        online_keys = set(device.data)
+
+        device._set_offline()
+
+        assert set(device.data) == online_keys
+
     def test_check_online_malformed_response(self, mock_socket):
         """Test _check_online with malformed response."""
         mock_socket.recvfrom.side_effect = [
@@ -541,20 +852,133 @@ class TestSnapmakerDevice:
         assert len(devices) == 1
         assert devices[0]["host"] == "192.168.1.100"
 
-    def test_check_online_socket_closed_on_exception(self):
-        """Test that socket is closed even when exception occurs."""
+    def test_check_online_reuses_socket(self, mock_socket):
+        """Test that the discovery socket is created once and reused."""
         with patch(
-            "custom_components.snapmaker.snapmaker.socket.socket"
+            "custom_components.snapmaker.snapmaker.socket.socket",
+            return_value=mock_socket,
         ) as mock_socket_class:
-            socket_instance = MagicMock()
-            socket_instance.sendto.side_effect = Exception("Send error")
-            mock_socket_class.return_value = socket_instance
+            device = SnapmakerDevice("192.168.1.100")
+            device._check_online()
+            device._check_online()
 
+            mock_socket_class.assert_called_once()
+            mock_socket.close.assert_not_called()
+
+    def test_check_online_drains_late_replies(self, mock_socket):
+        """Test that replies queued since the last poll are discarded first."""
+        mock_socket.recv.side_effect = [b"stale", BlockingIOError(), BlockingIOError()]
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._check_online()
+
+        assert mock_socket.recv.call_count == 3
+        assert device.available is True
+
+    def test_check_online_drains_after_match(self, mock_socket):
+        """Test that queued replies are discarded once our device answered."""
+        mock_socket.recv.side_effect = [
+            BlockingIOError(),
+            b"IP@192.168.1.101|Model:Snapmaker A250|Status:IDLE",
+            BlockingIOError(),
+        ]
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._check_online()
+
+        assert device.available is True
+        mock_socket.recvfrom.assert_called_once()
+        assert mock_socket.recv.call_count == 3
+
+    def test_check_online_rebuilds_socket_after_os_error(self, mock_socket):
+        """Test that a socket raising OSError is replaced for the resend."""
+        mock_socket.sendto.side_effect = [OSError("Network is unreachable"), None]
+
+        with patch(
+            "custom_components.snapmaker.snapmaker.socket.socket",
+            return_value=mock_socket,
+        ) as mock_socket_class:
             device = SnapmakerDevice("192.168.1.100")
             device._check_online()
 
-            # Socket should be closed even though exception occurred
-            socket_instance.close.assert_called_once()
+            assert mock_socket_class.call_count == 2
+            mock_socket.close.assert_called_once()
+            assert device.available is True
+
+    def test_close_closes_discovery_socket(self, mock_socket):
+        """Test that close() releases the discovery socket, even after errors."""
+        mock_socket.sendto.side_effect = Exception("Send error")
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._check_online()
+        mock_socket.close.assert_not_called()
+
+        device.close()
+        mock_socket.close.assert_called_once()
+
+
+class TestParseDiscovery:
+    """Test parsing of UDP discovery replies."""
+
+    ADDR = ("192.168.1.100", 20054)
+
+    def test_parse_valid_reply(self):
+        """Test that all three fields are extracted from a valid reply."""
+        assert _parse_discovery(
+            b"IP@192.168.1.100|Model:Snapmaker A350|Status:IDLE", self.ADDR
+        ) == ("192.168.1.100", "Snapmaker A350", "IDLE")
+
+    def test_parse_ignores_trailing_fields(self):
+        """Test that extra fields after the status are ignored."""
+        assert _parse_discovery(
+            b"IP@192.168.1.100|Model:Snapmaker A350|Status:RUNNING|SACP:1", self.ADDR
+        ) == ("192.168.1.100", "Snapmaker A350", "RUNNING")
+
+    def test_parse_missing_separator(self):
+        """Test that a reply missing a field separator is rejected."""
+        assert (
+            _parse_discovery(b"IP@192.168.1.100|Snapmaker A350|IDLE", self.ADDR) is None
+        )
+
+    def test_parse_rejects_unrelated_datagram(self):
+        """Test that datagrams without the reply separators are rejected early."""
+        with patch("custom_components.snapmaker.snapmaker._DISCOVERY_RE") as regex:
+            assert _parse_discovery(b"M-SEARCH * HTTP/1.1", self.ADDR) is None
+
+        regex.match.assert_not_called()
+
+    def test_parse_invalid_utf8_field(self):
+        """Test that undecodable field bytes are rejected."""
+        assert (
+            _parse_discovery(b"IP@192.168.1.100|Model:\xff\xfe|Status:IDLE", self.ADDR)
+            is None
+        )
+
+    def test_parse_logs_sender(self, caplog):
+        """Test that a rejected reply is logged with the sender address."""
+        import logging
+
+        with caplog.at_level(logging.WARNING):
+            assert _parse_discovery(b"INVALID", ("192.168.1.42", 20054)) is None
+
+        assert "Malformed discovery response from 192.168.1.42" in caplog.text
+
+
+class TestFormatDuration:
+    """Test the cached duration formatter."""
+
+    def test_format_duration(self):
+        """Test that durations keep the timedelta string format."""
+        assert _format_duration(300) == "0:05:00"
+        assert _format_duration(90061) == "1 day, 1:01:01"
+
+    def test_format_duration_is_cached(self):
+        """Test that repeated values are served from the cache."""
+        _format_duration.cache_clear()
+        _format_duration(42)
+        _format_duration(42)
+
+        assert _format_duration.cache_info().hits == 1
 
 
 class TestTCPReachability:
@@ -622,17 +1046,124 @@ class TestTCPReachability:
             device = SnapmakerDevice("192.168.1.100")
             assert device._check_reachable() is False
 
-    def test_update_skips_api_when_unreachable(self, mock_socket):
-        """Test that update skips API calls when TCP check fails."""
-        # Discovery succeeds but TCP check fails
-        with patch("custom_components.snapmaker.snapmaker.time.sleep"):
-            mock_socket.connect_ex.return_value = 1  # TCP check fails
+    def test_update_after_discovery_skips_tcp_check(self, mock_socket, mock_requests):
+        """Test that a fresh discovery reply goes straight to the HTTP API."""
+        device = SnapmakerDevice("192.168.1.100")
+        device.update()
+
+        mock_socket.connect_ex.assert_not_called()
+        mock_requests.get.assert_called_once()
+
+    def test_update_offline_when_api_refuses_connection(
+        self, mock_socket, mock_requests
+    ):
+        """Test that a refused API connection after discovery marks offline."""
+        mock_requests.post.side_effect = requests.exceptions.ConnectionError(
+            "Connection refused"
+        )
+
+        device = SnapmakerDevice("192.168.1.100")
+        device.update()
+
+        assert device.available is False
+        assert device.status == "OFFLINE"
+
+    def test_update_skips_discovery_when_reachable(self, mock_socket, mock_requests):
+        """Test that discovery is skipped while the known host stays reachable."""
+        device = SnapmakerDevice("192.168.1.100")
+        device.update()
+        assert mock_socket.sendto.call_count == 1
 
+        device.update()
+
+        # Second update only needed the TCP check, not another broadcast
+        assert mock_socket.sendto.call_count == 1
+        assert device.available is True
+        assert device.model == "Snapmaker A350"
+
+    def test_update_drops_fields_missing_from_later_status(
+        self, mock_socket, mock_requests
+    ):
+        """Test that reachable polls don't keep fields from an older payload."""
+        mock_requests.get.return_value.content = b"""{
+            "status": "RUNNING",
+            "toolHead": "TOOLHEAD_LASER_1",
+            "laserPower": 80
+        }"""
+
+        device = SnapmakerDevice("192.168.1.100")
+        device.update()
+        assert device.data["laser_power"] == 80
+
+        mock_requests.get.return_value.content = b"""{
+            "status": "IDLE",
+            "toolHead": "TOOLHEAD_LASER_1"
+        }"""
+        device.update()
+
+        # The second poll skipped discovery, so the data dict was reused
+        assert mock_socket.sendto.call_count == 1
+        assert "laser_power" not in device.data
+
+    def test_get_status_drops_other_nozzle_layout(self, mock_requests):
+        """Test that switching nozzle layouts removes the old nozzle keys."""
+        mock_requests.get.return_value.content = b"""{
+            "status": "IDLE",
+            "toolHead": "TOOLHEAD_3DPRINTING_1",
+            "nozzle1Temperature": 200.0,
+            "nozzle2Temperature": 210.0
+        }"""
+
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = "test-token-123"
+        device._available = True
+        device._get_status()
+        assert "nozzle1_temperature" in device.data
+
+        mock_requests.get.return_value.content = b"""{
+            "status": "IDLE",
+            "toolHead": "TOOLHEAD_3DPRINTING_1",
+            "nozzleTemperature": 25.0
+        }"""
+        device._get_status()
+
+        assert device.data["nozzle_temperature"] == 25.0
+        assert "nozzle1_temperature" not in device.data
+        assert "nozzle2_target_temperature" not in device.data
+
+    def test_update_without_token_keeps_discovering(self, mock_socket, mock_requests):
+        """Test that a device without a token still refreshes its status."""
+        mock_requests.post.return_value.content = b"{}"
+
+        device = SnapmakerDevice("192.168.1.100")
+        device.update()
+        assert device.token is None
+        assert device.status == "IDLE"
+
+        mock_socket.recvfrom.return_value = (
+            b"IP@192.168.1.100|Model:Snapmaker A350|Status:RUNNING",
+            ("192.168.1.100", 20054),
+        )
+        device.update()
+
+        # Discovery ran again despite the open API port
+        assert mock_socket.sendto.call_count == 2
+        mock_socket.connect_ex.assert_not_called()
+        assert device.status == "RUNNING"
+
+    def test_update_rediscovers_when_unreachable(self, mock_socket, mock_requests):
+        """Test that discovery runs again once the API port stops answering."""
+        with patch("custom_components.snapmaker.snapmaker.time.sleep"):
             device = SnapmakerDevice("192.168.1.100")
-            result = device.update()
+            device.update()
 
-            assert device.available is False
-            assert device.status == "OFFLINE"
+            mock_socket.connect_ex.return_value = 1
+            device.update()
+
+            # Discovery ran again; the HTTP API then confirmed the device
+            assert mock_socket.sendto.call_count == 2
+            assert mock_requests.get.call_count == 2
+            assert device.available is True
 
     def test_check_reachable_exponential_backoff(self):
         """Test that exponential backoff is used between retries."""
@@ -641,6 +1172,7 @@ class TestTCPReachability:
                 "custom_components.snapmaker.snapmaker.socket.socket"
             ) as mock_socket_class,
             patch("custom_components.snapmaker.snapmaker.time.sleep") as mock_sleep,
+            patch("custom_components.snapmaker.snapmaker.REACHABILITY_MAX_RETRIES", 4),
         ):
             sock = MagicMock()
             sock.connect_ex.return_value = 1
@@ -649,12 +1181,81 @@ class TestTCPReachability:
             device = SnapmakerDevice("192.168.1.100")
             device._check_reachable()
 
-            # With REACHABILITY_MAX_RETRIES=2, there's 1 sleep between attempts
-            # Backoff with base=1: 1^0=1
-            expected_sleeps = [call(1)]
+            # 4 attempts, so 3 sleeps doubling from the initial 0.25s
+            expected_sleeps = [call(0.25), call(0.5), call(1.0)]
             assert mock_sleep.call_args_list == expected_sleeps
 
 
+class TestHostResolution:
+    """Test resolving the configured host once."""
+
+    def test_hostname_resolved_once(self, mock_socket, mock_requests):
+        """Test that a hostname is looked up once and its address reused."""
+        with patch(
+            "custom_components.snapmaker.snapmaker.socket.gethostbyname",
+            return_value="192.168.1.100",
+        ) as mock_resolve:
+            device = SnapmakerDevice("snapmaker.local")
+            device.update()
+            device.update()
+
+        mock_resolve.assert_called_once_with("snapmaker.local")
+        assert device.available is True
+        mock_socket.sendto.assert_called_with(b"discover", ("192.168.1.100", 20054))
+        assert mock_requests.get.call_args[0][0].startswith("http://192.168.1.100:")
+
+    def test_hostname_resolved_again_after_offline(self):
+        """Test that going offline drops the cached address."""
+        with patch(
+            "custom_components.snapmaker.snapmaker.socket.gethostbyname",
+            side_effect=["192.168.1.100", "192.168.1.101"],
+        ):
+            device = SnapmakerDevice("snapmaker.local")
+            assert device._resolve_host() == "192.168.1.100"
+            device._set_offline()
+            assert device._resolve_host() == "192.168.1.101"
+
+    def test_unresolvable_host_falls_back_to_name(self):
+        """Test that a failed lookup uses the configured host as is."""
+        with patch(
+            "custom_components.snapmaker.snapmaker.socket.gethostbyname",
+            side_effect=socket.gaierror("Name or service not known"),
+        ):
+            device = SnapmakerDevice("snapmaker.local")
+            assert device._resolve_host() == "snapmaker.local"
+
+
+class TestHTTPSession:
+    """Test the persistent HTTP session."""
+
+    def test_requests_share_one_session(self, mock_requests):
+        """Test that token and status requests reuse the device session."""
+        device = SnapmakerDevice("192.168.1.100")
+        device._token = device._get_token()
+        device._get_status()
+
+        assert mock_requests.post.call_count == 2
+        mock_requests.get.assert_called_once()
+
+    def test_session_retries_transient_gateway_errors(self, mock_requests):
+        """Test that the mounted adapter retries 502-504 but not connects."""
+        SnapmakerDevice("192.168.1.100")
+
+        prefix, adapter = mock_requests.mount.call_args[0]
+        assert prefix == "http://"
+        assert adapter.max_retries.status_forcelist == (502, 503, 504)
+        assert adapter.max_retries.connect == 0
+        assert "POST" not in adapter.max_retries.allowed_methods
+        assert adapter.max_retries.respect_retry_after_header is False
+
+    def test_close_closes_session(self, mock_requests):
+        """Test that close() releases the pooled HTTP connections."""
+        device = SnapmakerDevice("192.168.1.100")
+        device.close()
+
+        mock_requests.close.assert_called_once()
+
+
 class TestTokenPersistence:
     """Test token persistence feature."""
 
@@ -668,7 +1269,7 @@ class TestTokenPersistence:
 
     def test_token_callback_not_called_on_failure(self, mock_requests):
         """Test that callback is not called when token retrieval fails."""
-        mock_requests.post.return_value.text = "{}"
+        mock_requests.post.return_value.content = b"{}"
 
         callback = MagicMock()
         device = SnapmakerDevice("192.168.1.100")
@@ -715,7 +1316,7 @@ class TestSensitiveKeyFiltering:
 
     def test_warns_on_suspicious_api_keys(self, mock_requests, caplog):
         """Test that a warning is logged for API keys matching sensitive patterns."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "IDLE",
             "apiSecretKey": "some-value",
             "nozzleTemperature": 25.0
@@ -733,7 +1334,7 @@ class TestSensitiveKeyFiltering:
 
     def test_no_warning_for_known_filtered_keys(self, mock_requests, caplog):
         """Test that no warning is logged for keys already in the filter set."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "IDLE",
             "token": "filtered-value",
             "nozzleTemperature": 25.0
@@ -749,6 +1350,24 @@ class TestSensitiveKeyFiltering:
 
         assert "potentially sensitive key" not in caplog.text
 
+    def test_warns_once_per_suspicious_key(self, mock_requests, caplog):
+        """Test that a suspicious key is only reported on the first response."""
+        mock_requests.get.return_value.content = b"""{
+            "status": "IDLE",
+            "apiSecretKey": "some-value"
+        }"""
+
+        import logging
+
+        with caplog.at_level(logging.WARNING):
+            device = SnapmakerDevice("192.168.1.100")
+            device._token = "test-token-123"
+            device._available = True
+            device._get_status()
+            device._get_status()
+
+        assert caplog.text.count("potentially sensitive key 'apiSecretKey'") == 1
+
 
 class TestTokenCallbackEdgeCases:
     """Test edge cases for the token update callback."""
@@ -773,7 +1392,7 @@ class TestTokenCallbackEdgeCases:
 
     def test_callback_with_none_token_not_called(self, mock_requests):
         """Test that callback is not invoked with None token."""
-        mock_requests.post.return_value.text = "{}"
+        mock_requests.post.return_value.content = b"{}"
 
         callback = MagicMock()
         device = SnapmakerDevice("192.168.1.100")
@@ -793,7 +1412,7 @@ class TestStatusTokenSecurity:
         device._available = True
         device._get_status()
 
-        # Verify requests.get was called with params kwarg
+        # Verify session.get was called with params kwarg
         mock_requests.get.assert_called_once()
         call_args = mock_requests.get.call_args
 
@@ -810,7 +1429,7 @@ class TestDualExtruderDetection:
 
     def test_single_extruder_with_nozzle_temperature(self, mock_requests):
         """Test single extruder when nozzleTemperature is present."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "IDLE",
             "toolHead": "TOOLHEAD_3DPRINTING_1",
             "nozzleTemperature": 25.0,
@@ -829,7 +1448,7 @@ class TestDualExtruderDetection:
 
     def test_dual_extruder_with_both_nozzle_fields(self, mock_requests):
         """Test dual extruder detected from nozzle1/nozzle2 fields."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "RUNNING",
             "toolHead": "TOOLHEAD_3DPRINTING_2",
             "nozzle1Temperature": 210.0,
@@ -854,7 +1473,7 @@ class TestDualExtruderDetection:
         self, mock_requests
     ):
         """Test dual extruder detected when TOOLHEAD_3DPRINTING_1 has no nozzleTemperature."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "IDLE",
             "toolHead": "TOOLHEAD_3DPRINTING_1",
             "nozzle1Temperature": 25.0,
@@ -874,7 +1493,7 @@ class TestDualExtruderDetection:
 
     def test_non_printing_toolhead_not_dual(self, mock_requests):
         """Test that CNC/laser toolheads are never detected as dual extruder."""
-        mock_requests.get.return_value.text = """{
+        mock_requests.get.return_value.content = b"""{
             "status": "IDLE",
             "toolHead": "TOOLHEAD_CNC_1",
             "heatedBedTemperature": 0,